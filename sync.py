@@ -26,29 +26,161 @@ Version 3.3.0 - Graduated alerts, history.json, notifications, smart fitness met
 """
 
 import requests
+from urllib3.util.retry import Retry  # ships with requests
 import json
 import os
+import sys
+
+try:
+    # Optional: ~5x faster JSON serialization when available
+    import orjson
+except ImportError:
+    orjson = None
 import argparse
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, date
+from typing import Dict, Iterable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import base64
+import bisect
+import gzip
+import hashlib
 import math
-import statistics
-from collections import defaultdict
+import operator
+import threading
+from collections import Counter, defaultdict
 from pathlib import Path
 
 
+def _write_json(path, obj, sort_keys: bool = False, default=None):
+    """Write obj as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        buf = orjson.dumps(obj, option=option, default=default)
+    else:
+        # dumps-then-write: json.dump streams thousands of small writes
+        # through the text layer; one encode and one write is cheaper
+        buf = json.dumps(obj, indent=2, sort_keys=sort_keys,
+                         default=default).encode()
+    with open(path, 'wb') as f:
+        f.write(buf)
+
+
+def _load_json(path):
+    """Read and parse a JSON file, using orjson when installed.
+
+    Reads bytes either way — orjson wants them, and handing stdlib json
+    the raw buffer skips the text-mode decode layer.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps_json_bytes(obj, default=None) -> bytes:
+    """Encode obj as indented JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=default)
+    return json.dumps(obj, indent=2, default=default).encode()
+
+
+def _iso_day(d) -> str:
+    """
+    Format a date/datetime as YYYY-MM-DD. Noticeably faster than
+    strftime in the per-day tier loops since it skips format-string
+    parsing and locale handling.
+    """
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _fmt_pct(value: Optional[float]) -> Optional[str]:
+    """Signed percentage display string (e.g. '+3.2%'), or None."""
+    return f"{value:+.1%}" if value is not None else None
+
+
+# fromisoformat parses a trailing 'Z' natively from 3.11 on; older
+# interpreters need it rewritten to an explicit UTC offset first
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Sort rank for alert severity — lower sorts first within a tier
+_SEVERITY_ORDER = {"alarm": 0, "warning": 1, "info": 2}
+
+# Display icon per alert severity ("info" and anything unknown fall
+# back to the info icon)
+_ALERT_ICON = {"alarm": "🔴", "warning": "🟡"}
+
+# Fixed day offsets for race-week arithmetic, built once instead of
+# allocating a timedelta per call
+_TD2 = timedelta(days=2)
+_TD4 = timedelta(days=4)
+_TD7 = timedelta(days=7)
+
+# Zone id → aggregation bucket (0: z1/z2 easy, 1-5: z3..z7), with both
+# casings precomputed so the per-record dispatch is one dict lookup with
+# no .lower() allocation
+_ZONE_BUCKET = {"z1": 0, "z2": 0, "z3": 1, "z4": 2, "z5": 3, "z6": 4, "z7": 5}
+_ZONE_BUCKET.update({k.upper(): v for k, v in _ZONE_BUCKET.items()})
+
+# Fixed note strings for the TID comparison payload
+_TID_NOTE_INSUFFICIENT = ("Compares 7d vs 28d Seiler TID to detect "
+                          "distribution shifts. Insufficient data in "
+                          "one or both windows.")
+_TID_NOTE_OK = ("Compares 7d vs 28d Seiler TID to detect "
+                "distribution shifts. pi_delta positive = "
+                "more polarized acutely.")
+
+
+def _alert_emitter(alerts: List[Dict]):
+    """
+    Return an append helper bound to alerts that builds the standard
+    alert shape — one dict-literal site instead of one per threshold.
+    """
+    def emit(metric, value, severity, threshold, context, tier,
+             persistence_days=None):
+        alerts.append({
+            "metric": metric,
+            "value": value,
+            "severity": severity,
+            "threshold": threshold,
+            "context": context,
+            "persistence_days": persistence_days,
+            "tier": tier,
+            # Precomputed sort rank — stripped again before the alerts
+            # leave the generator (see _strip_sort_keys)
+            "_sort_key": (tier, _SEVERITY_ORDER.get(severity, 3))
+        })
+    return emit
+
+
+def _strip_sort_keys(alerts: List[Dict]) -> List[Dict]:
+    """Drop the internal _sort_key helper entry so it never reaches output."""
+    for a in alerts:
+        del a["_sort_key"]
+    return alerts
+
+
 class IntervalsSync:
     """Sync Intervals.icu data to GitHub repository or local file"""
     
     INTERVALS_BASE_URL = "https://intervals.icu/api/v1"
     GITHUB_API_URL = "https://api.github.com"
     FTP_HISTORY_FILE = "ftp_history.json"
+    ETAG_CACHE_FILE = ".intervals_etag_cache.json"
+    DAY_STATS_CACHE_FILE = ".day_stats_cache.json"
+    # History regens refetch only this trailing window on warm runs;
+    # older days come from the cached per-day aggregates. Wide enough to
+    # pick up late uploads and edits to recent rides.
+    DAY_STATS_REFETCH_DAYS = 42
     HISTORY_FILE = "history.json"
     UPSTREAM_REPO = "CrankAddict/section-11"
     CHANGELOG_FILE = "changelog.json"
     VERSION = "3.5.1"
 
+    # PMC decay constants (fixed — computed once at class creation)
+    CTL_DECAY = math.exp(-1/42)  # ~0.9765
+    ATL_DECAY = math.exp(-1/7)   # ~0.8668
+
     # Sport family mapping for per-sport monotony calculation
     # Multi-sport athletes get inflated total monotony when cross-training
     # adds a consistent TSS floor across days. Per-sport monotony isolates
@@ -72,12 +204,101 @@ class IntervalsSync:
         "Yoga": "other",
         "Workout": "other",
     }
-    
+    # Interned values make the cached _sport_family comparisons in hot
+    # loops resolve on the pointer-equality fast path
+    SPORT_FAMILIES = {k: sys.intern(v) for k, v in SPORT_FAMILIES.items()}
+
     # Activity types that may contain location data in their name
-    OUTDOOR_TYPES = {"Ride", "MountainBikeRide", "GravelRide", "EBikeRide",
-                     "Run", "TrailRun", "NordicSki", "Walk", "Hike"}
+    OUTDOOR_TYPES = frozenset({"Ride", "MountainBikeRide", "GravelRide", "EBikeRide",
+                               "Run", "TrailRun", "NordicSki", "Walk", "Hike"})
+
+    # Alias chains for _format_activities — Intervals.icu and upstream
+    # providers disagree on field names, so each canonical output field
+    # probes these keys in order (first truthy value wins, mirroring the
+    # old per-field `or` chains)
+    _AVG_POWER_KEYS = ("average_watts", "avg_watts", "average_power",
+                       "avgWatts", "icu_average_watts")
+    _NORM_POWER_KEYS = ("weighted_average_watts", "np", "icu_pm_np",
+                        "normalizedPower", "icu_weighted_avg_watts")
+    _AVG_HR_KEYS = ("average_heartrate", "avg_hr", "average_heart_rate",
+                    "avgHr", "icu_average_hr")
+    _MAX_HR_KEYS = ("max_heartrate", "max_hr", "max_heart_rate",
+                    "maxHr", "icu_max_hr")
+    _AVG_CADENCE_KEYS = ("average_cadence", "avg_cadence", "icu_average_cadence")
+    _AVG_TEMP_KEYS = ("average_weather_temp", "average_temp", "avg_temp",
+                      "average_temperature")
+    _CALORIES_KEYS = ("calories", "icu_calories")
+    _DECOUPLING_KEYS = ("icu_hr_decoupling", "decoupling")
+    _AVG_PACE_KEYS = ("average_pace", "icu_pace")
+    _WEATHER_KEYS = ("weather_description", "weather")
+    _HUMIDITY_KEYS = ("humidity", "average_humidity")
+    _WIND_KEYS = ("average_wind_speed", "wind_speed")
+
+    # Zone labels for the per-activity zone_distribution block. The
+    # power-zone table maps ids straight to output labels with both
+    # casings precomputed (same trick as _ZONE_BUCKET), so the per-zone
+    # dispatch is one dict probe with no .lower() or f-string allocation
+    _HR_ZONE_LABELS = ("z1_time", "z2_time", "z3_time", "z4_time",
+                       "z5_time", "z6_time", "z7_time")
+    _POWER_ZONE_LABELS = {f"z{n}": f"z{n}_time" for n in range(1, 8)}
+    _POWER_ZONE_LABELS.update({f"Z{n}": f"z{n}_time" for n in range(1, 8)})
+
+    # Event categories treated as races by the race calendar
+    _RACE_CATEGORIES = frozenset({"RACE_A", "RACE_B", "RACE_C"})
+    _RACE_AB = frozenset({"RACE_A", "RACE_B"})
+
+    # Single C-level extraction of every derived metric the alert pass
+    # reads (the dict always carries these keys)
+    _ALERT_METRICS = operator.itemgetter(
+        "acwr", "monotony", "effective_monotony", "primary_sport",
+        "primary_sport_monotony", "multi_sport_detected", "strain",
+        "recovery_index", "latest_hrv", "latest_rhr",
+        "hrv_baseline_7d", "rhr_baseline_7d"
+    )
+
+    # Hard-day ladder: (index into the reverse cumulative zone array,
+    # seconds threshold). cum[0]=z7 ... cum[4]=z3-and-above.
+    # z3+: 30 min tempo+, z4+: 10 min threshold+, z5+: 5 min VO2max+,
+    # z6+: 2 min anaerobic+, z7: 1 min neuromuscular
+    _HARD_DAY_LADDER = ((4, 1800), (3, 600), (2, 300), (1, 120), (0, 60))
+
+    # ACWR bands per Gabbett guidelines: bisect over the upper bounds
+    # picks the matching label (<0.8, 0.8-1.3, 1.3-1.5, >1.5)
+    _ACWR_THRESHOLDS = (0.8, 1.3, 1.5)
+    _ACWR_LABELS = ("undertraining", "optimal", "caution", "danger")
+
+    # Seasonal context by calendar month (index month - 1); assumes a
+    # Northern Hemisphere cycling calendar
+    # Seasons cover two months each, so (month - 1) // 2 indexes this
+    _SEASON_BY_MONTH_PAIR = (
+        "Early Base",                 # Jan-Feb
+        "Late Base / Build",          # Mar-Apr
+        "Build / Early Race Season",  # May-Jun
+        "Peak Race Season",           # Jul-Aug
+        "Late Season / Transition",   # Sep-Oct
+        "Off-season / Transition",    # Nov-Dec
+    )
+
+    # Expected benchmark-index range (low, high) per seasonal phase
+    _BENCHMARK_EXPECTATIONS = {
+        "Off-season / Transition": (-0.05, -0.02),
+        "Early Base": (-0.02, 0.01),
+        "Late Base / Build": (0.02, 0.05),
+        "Build / Early Race Season": (0.01, 0.04),
+        "Peak Race Season": (0.01, 0.03),
+        "Late Season / Transition": (-0.03, 0.00),
+    }
     
-    def __init__(self, athlete_id: str, intervals_api_key: str, github_token: str = None, 
+    # All instance state is assigned in __init__; slots skip the
+    # per-instance __dict__ and make the many self.* reads in the hot
+    # metric loops descriptor-fast
+    __slots__ = ("athlete_id", "intervals_auth", "github_token",
+                 "github_repo", "debug", "script_dir", "_session",
+                 "_gh_session", "_etag_cache", "_etag_lock",
+                 "_etag_keys_used", "_etag_dirty", "_now",
+                 "_history_meta", "_ftp_history")
+
+    def __init__(self, athlete_id: str, intervals_api_key: str, github_token: str = None,
                  github_repo: str = None, debug: bool = False):
         self.athlete_id = athlete_id
         self.intervals_auth = base64.b64encode(f"API_KEY:{intervals_api_key}".encode()).decode()
@@ -85,51 +306,196 @@ class IntervalsSync:
         self.github_repo = github_repo
         self.debug = debug
         self.script_dir = Path(__file__).parent
-    
+
+        # One wall-clock snapshot per run: the calendar-gated helpers
+        # (seasonal context, history refresh) all see the same instant,
+        # so a midnight/month rollover can't split a sync
+        self._now = datetime.now()
+
+        # Persistent sessions: connections are pooled and reused across
+        # calls instead of paying a TCP+TLS handshake each time, and
+        # transient gateway errors get a retried request with backoff
+        retries = Retry(total=3, backoff_factor=0.3,
+                        status_forcelist=[502, 503, 504])
+        self._session = requests.Session()
+        self._session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=8, max_retries=retries
+        ))
+        self._session.headers.update({
+            "Authorization": f"Basic {self.intervals_auth}",
+            "Accept": "application/json"
+        })
+
+        # Separate session for GitHub — different host, auth scheme and
+        # Accept header than the Intervals.icu one. The token stays per
+        # request so the raw.githubusercontent fetch never carries it.
+        self._gh_session = requests.Session()
+        self._gh_session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=2, pool_maxsize=4, max_retries=retries
+        ))
+        self._gh_session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "User-Agent": f"intervals-sync/{self.VERSION}"
+        })
+
+        # ETag cache for conditional GETs (loaded lazily, guarded for the
+        # concurrent fetch phase). Keys requested this run are tracked so
+        # the end-of-run flush can prune entries whose date ranges have
+        # rolled out of the sync windows.
+        self._etag_cache = None
+        self._etag_lock = threading.Lock()
+        self._etag_keys_used = set()
+        self._etag_dirty = False
+
+        # Memoized history.json metadata (loaded lazily, once per run)
+        self._history_meta = None
+
+        # Memoized ftp_history.json contents — read at most once per run;
+        # _save_ftp_history keeps it in step with what is on disk
+        self._ftp_history = None
+
+    def _load_etag_cache(self) -> Dict:
+        """Load the ETag sidecar cache from disk (empty dict if absent/corrupt)"""
+        cache_path = self.script_dir / self.ETAG_CACHE_FILE
+        if cache_path.exists():
+            try:
+                return _load_json(cache_path)
+            except Exception as e:
+                if self.debug:
+                    print(f"  Could not load ETag cache: {e}")
+        return {}
+
+    def _save_etag_cache(self):
+        """
+        Persist the ETag sidecar cache next to ftp_history.json.
+
+        Called once at the end of a fetch phase, not per store. Only
+        keys requested during this run are written: the keys embed the
+        request's date range, which rolls forward daily, so anything
+        not re-requested is a dead entry (with a full response body
+        attached) and is pruned here instead of accumulating forever.
+        """
+        if not self._etag_dirty:
+            return
+        cache_path = self.script_dir / self.ETAG_CACHE_FILE
+        with self._etag_lock:
+            live = {k: v for k, v in self._etag_cache.items()
+                    if k in self._etag_keys_used}
+            self._etag_dirty = False
+        try:
+            _write_json(cache_path, live)
+        except Exception as e:
+            if self.debug:
+                print(f"  Could not save ETag cache: {e}")
+
     def _intervals_get(self, endpoint: str, params: Dict = None) -> Dict:
-        """Fetch from Intervals.icu API"""
+        """
+        Fetch from Intervals.icu API.
+
+        Date-range activities/wellness fetches barely change between
+        same-day runs, so send If-None-Match when we hold an ETag for the
+        exact range and reuse the cached body on 304 Not Modified — skips
+        the transfer and the JSON parse entirely.
+        """
         if endpoint:
             url = f"{self.INTERVALS_BASE_URL}/athlete/{self.athlete_id}/{endpoint}"
         else:
             url = f"{self.INTERVALS_BASE_URL}/athlete/{self.athlete_id}"
-        headers = {
-            "Authorization": f"Basic {self.intervals_auth}",
-            "Accept": "application/json"
-        }
-        response = requests.get(url, headers=headers, params=params)
+
+        cache_key = None
+        cached = None
+        if endpoint in ("activities", "wellness") and params:
+            cache_key = f"{endpoint}|{params.get('oldest', '')}|{params.get('newest', '')}"
+            with self._etag_lock:
+                if self._etag_cache is None:
+                    self._etag_cache = self._load_etag_cache()
+                self._etag_keys_used.add(cache_key)
+                cached = self._etag_cache.get(cache_key)
+
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+        response = self._session.get(url, params=params, headers=headers, timeout=30)
+
+        if response.status_code == 304 and cached:
+            if self.debug:
+                print(f"  {endpoint}: 304 Not Modified — using cached body")
+            # Hand back per-element copies so callers that annotate the
+            # rows in place (_annotate_activities) don't mutate the
+            # cached body
+            body = cached["body"]
+            return [dict(row) for row in body] if isinstance(body, list) else body
+
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+
+        if cache_key:
+            etag = response.headers.get("ETag")
+            if etag:
+                # Same copy on store: annotation only adds top-level
+                # keys, so a shallow per-row copy is enough to keep the
+                # private _-keys out of the sidecar
+                body = [dict(row) for row in data] if isinstance(data, list) else data
+                with self._etag_lock:
+                    self._etag_cache[cache_key] = {"etag": etag, "body": body}
+                    self._etag_dirty = True
+
+        return data
     
-    def _fetch_today_wellness(self) -> Dict:
+    def _annotate_activities(self, activities: List[Dict]) -> None:
         """
-        Fetch today's wellness data which contains:
-        - CTL, ATL, rampRate (but these include planned workouts!)
-        - sportInfo with eFTP, W', P-max (accurate live estimates)
-        - VO2max, sleep quality/hours, etc.
+        One-pass enrichment of fetched activities.
+
+        Caches derived keys on each dict so downstream helpers read them
+        directly instead of re-deriving per pass:
+        - _date: start_date_local[:10]
+        - _day_ord: proleptic ordinal of _date (None if unparseable)
+        - _sport_family: SPORT_FAMILIES mapping of the activity type
+        - _tss: icu_training_load coerced to a number (0 if absent/None)
+        - _moving: moving_time coerced to a number (0 if absent/None)
         """
-        today = datetime.now().strftime("%Y-%m-%d")
-        try:
-            data = self._intervals_get(f"wellness/{today}")
-            return data
-        except Exception as e:
-            if self.debug:
-                print(f"  Could not fetch today's wellness: {e}")
-            return {}
-    
+        fam_of = self.SPORT_FAMILIES.get
+        for a in activities:
+            date10 = a.get("start_date_local", "")[:10]
+            a["_date"] = date10
+            try:
+                a["_day_ord"] = date.fromisoformat(date10).toordinal() if date10 else None
+            except ValueError:
+                a["_day_ord"] = None
+            a["_sport_family"] = fam_of(a.get("type", "Unknown"), "other")
+            a["_tss"] = a.get("icu_training_load") or 0
+            a["_moving"] = a.get("moving_time") or 0
+
+    @classmethod
+    def _is_hard_day(cls, z3: int, z4: int, z5: int, z6: int, z7: int) -> bool:
+        """
+        Zone ladder hard-day check: cumulative thresholds z3+ / z4+ /
+        z5+ / z6+ / z7 per Seiler's polarized model + Foster's session
+        RPE scaling. One reverse scan builds every z-and-above sum; the
+        _HARD_DAY_LADDER thresholds index into it (cum[0]=z7 ... cum[4]=z3+).
+        """
+        c = z7
+        cum = [c]
+        for v in (z6, z5, z4, z3):
+            c += v
+            cum.append(c)
+        return any(cum[i] >= t for i, t in cls._HARD_DAY_LADDER)
+
+    @staticmethod
+    def _wellness_date(wellness_entry: Dict) -> str:
+        """Extract the YYYY-MM-DD date key from a wellness entry (API uses 'id')"""
+        if "id" in wellness_entry:
+            return wellness_entry["id"][:10]
+        return wellness_entry.get("date", "")
+
     def _extract_power_model_from_wellness(self, wellness_data: Dict) -> Dict:
         """
         Extract eFTP, W', P-max from wellness.sportInfo.
         These are the accurate live estimates that match the Intervals.icu UI.
         """
         sport_info = wellness_data.get("sportInfo", [])
-        
-        # Find cycling sport info
-        cycling_info = None
-        for sport in sport_info:
-            if sport.get("type") == "Ride":
-                cycling_info = sport
-                break
-        
+
+        # Find cycling sport info (first "Ride" entry, if any)
+        cycling_info = next((s for s in sport_info if s.get("type") == "Ride"), None)
+
         if not cycling_info:
             return {
                 "eftp": None,
@@ -164,112 +530,143 @@ class IntervalsSync:
             "outdoor": {"2026-01-01": 280, "2026-02-01": 287}
         }
         """
+        if self._ftp_history is not None:
+            return self._ftp_history
+
         ftp_history_path = self.script_dir / self.FTP_HISTORY_FILE
-        
+
+        data = {"indoor": {}, "outdoor": {}}
         if ftp_history_path.exists():
             try:
-                with open(ftp_history_path, 'r') as f:
-                    data = json.load(f)
-                    # Handle legacy format (flat dict) -> convert to new format
-                    if data and not ("indoor" in data or "outdoor" in data):
-                        if self.debug:
-                            print(f"  Converting legacy FTP history format...")
-                        return {"indoor": {}, "outdoor": data}
-                    return data
+                data = _load_json(ftp_history_path)
+                # Handle legacy format (flat dict) -> convert to new format
+                if data and not ("indoor" in data or "outdoor" in data):
+                    if self.debug:
+                        print(f"  Converting legacy FTP history format...")
+                    data = {"indoor": {}, "outdoor": data}
             except Exception as e:
                 if self.debug:
                     print(f"  Could not load FTP history: {e}")
-                return {"indoor": {}, "outdoor": {}}
-        return {"indoor": {}, "outdoor": {}}
+                data = {"indoor": {}, "outdoor": {}}
+
+        self._ftp_history = data
+        return data
     
-    def _save_ftp_history(self, history: Dict[str, Dict[str, int]], 
-                          current_ftp_indoor: int, current_ftp_outdoor: int) -> Dict[str, Dict[str, int]]:
+    def _save_ftp_history(self, history: Dict[str, Dict[str, int]],
+                          current_ftp_indoor: int, current_ftp_outdoor: int,
+                          now: datetime = None) -> Dict[str, Dict[str, int]]:
         """
         Save current FTPs to history file.
         Tracks indoor and outdoor FTP separately.
         Only adds entry if FTP changed from most recent entry.
         """
-        today = datetime.now().strftime("%Y-%m-%d")
+        if now is None:
+            now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
         
         # Ensure structure exists
         if "indoor" not in history:
             history["indoor"] = {}
         if "outdoor" not in history:
             history["outdoor"] = {}
-        
+
+        changed = False
+
         # Update indoor FTP if changed
         if current_ftp_indoor:
             indoor_history = history["indoor"]
             if indoor_history:
-                sorted_dates = sorted(indoor_history.keys(), reverse=True)
-                most_recent = indoor_history[sorted_dates[0]]
+                # ISO dates compare lexicographically — max() finds the most
+                # recent entry in O(n) without building a sorted list
+                most_recent = indoor_history[max(indoor_history)]
                 if current_ftp_indoor != most_recent:
                     history["indoor"][today] = current_ftp_indoor
+                    changed = True
                     if self.debug:
                         print(f"  Indoor FTP changed: {most_recent} → {current_ftp_indoor}")
             else:
                 history["indoor"][today] = current_ftp_indoor
+                changed = True
                 if self.debug:
                     print(f"  Indoor FTP recorded: {current_ftp_indoor}")
-        
+
         # Update outdoor FTP if changed
         if current_ftp_outdoor:
             outdoor_history = history["outdoor"]
             if outdoor_history:
-                sorted_dates = sorted(outdoor_history.keys(), reverse=True)
-                most_recent = outdoor_history[sorted_dates[0]]
+                most_recent = outdoor_history[max(outdoor_history)]
                 if current_ftp_outdoor != most_recent:
                     history["outdoor"][today] = current_ftp_outdoor
+                    changed = True
                     if self.debug:
                         print(f"  Outdoor FTP changed: {most_recent} → {current_ftp_outdoor}")
             else:
                 history["outdoor"][today] = current_ftp_outdoor
+                changed = True
                 if self.debug:
                     print(f"  Outdoor FTP recorded: {current_ftp_outdoor}")
-        
+
+        # Keep the memoized copy pointing at the (possibly mutated) dict
+        # so later readers in the same run see today's entries
+        self._ftp_history = history
+
+        # Skip the write entirely when neither FTP changed — re-serializing
+        # the whole sorted history every run costs CPU and disk for no reason
+        if not changed:
+            return history
+
         # Save to file
         ftp_history_path = self.script_dir / self.FTP_HISTORY_FILE
         try:
-            with open(ftp_history_path, 'w') as f:
-                json.dump(history, f, indent=2, sort_keys=True)
+            _write_json(ftp_history_path, history, sort_keys=True)
             if self.debug:
                 print(f"  FTP history saved to {ftp_history_path}")
         except Exception as e:
             if self.debug:
                 print(f"  Could not save FTP history: {e}")
-        
+
         return history
     
-    def _calculate_benchmark_index(self, current_ftp: int, ftp_history: Dict[str, int], 
-                                    ftp_type: str = "indoor") -> Tuple[Optional[float], Optional[int]]:
+    def _calculate_benchmark_index(self, current_ftp: int, ftp_history: Dict[str, int],
+                                    ftp_type: str = "indoor",
+                                    now: datetime = None) -> Tuple[Optional[float], Optional[int]]:
         """
         Calculate Benchmark Index = (FTP_current / FTP_8_weeks_ago) - 1
-        
+
         Returns (benchmark_index, ftp_8_weeks_ago)
         """
         if not current_ftp or not ftp_history:
             return None, None
-        
+
+        if now is None:
+            now = datetime.now()
         # Find FTP from ~8 weeks ago (56 days, with ±7 day tolerance)
-        target_date = datetime.now() - timedelta(days=56)
+        target_date = now - timedelta(days=56)
         earliest_acceptable = target_date - timedelta(days=7)
         latest_acceptable = target_date + timedelta(days=7)
         
-        # Find the closest FTP entry to 8 weeks ago
+        # Find the closest FTP entry to 8 weeks ago.
+        # ISO date keys compare lexicographically, so filter to the ±7-day
+        # window with string comparisons and only parse the few keys inside
+        # it (no strptime over the whole multi-year history).
+        earliest_str = earliest_acceptable.strftime("%Y-%m-%d")
+        latest_str = latest_acceptable.strftime("%Y-%m-%d")
+        target_day = target_date.date()
+
         best_match_date = None
         best_match_diff = float('inf')
-        
-        for date_str, ftp in ftp_history.items():
+
+        for date_str in ftp_history:
+            if not (earliest_str <= date_str <= latest_str):
+                continue
             try:
-                entry_date = datetime.strptime(date_str, "%Y-%m-%d")
-                
-                if earliest_acceptable <= entry_date <= latest_acceptable:
-                    diff = abs((entry_date - target_date).days)
-                    if diff < best_match_diff:
-                        best_match_diff = diff
-                        best_match_date = date_str
-            except:
+                entry_day = date.fromisoformat(date_str)
+            except ValueError:
                 continue
+            diff = abs((entry_day - target_day).days)
+            if diff < best_match_diff:
+                best_match_diff = diff
+                best_match_date = date_str
         
         if best_match_date:
             ftp_8_weeks_ago = ftp_history[best_match_date]
@@ -282,82 +679,112 @@ class IntervalsSync:
         
         # No data from 8 weeks ago
         if self.debug:
-            sorted_dates = sorted(ftp_history.keys())
-            if sorted_dates:
-                oldest_date = datetime.strptime(sorted_dates[0], "%Y-%m-%d")
-                days_of_history = (datetime.now() - oldest_date).days
+            if ftp_history:
+                oldest_date = datetime.fromisoformat(min(ftp_history))
+                days_of_history = (now - oldest_date).days
                 print(f"  Benchmark Index ({ftp_type}) unavailable: only {days_of_history} days of history (need ~56)")
         
         return None, None
     
     def collect_training_data(self, days_back: int = 7, anonymize: bool = False) -> Dict:
         """Collect all training data for LLM analysis"""
+        # Snapshot the clock once so every date boundary in this run is
+        # consistent (no midnight-rollover skew between today/yesterday/ranges)
+        now = datetime.now()
+
         # Extended range for ACWR calculation (need 28 days minimum)
         days_for_acwr = 28
-        oldest_extended = (datetime.now() - timedelta(days=days_for_acwr - 1)).strftime("%Y-%m-%d")
-        oldest_display = (datetime.now() - timedelta(days=days_back - 1)).strftime("%Y-%m-%d")
-        newest = datetime.now().strftime("%Y-%m-%d")
-        today = datetime.now().strftime("%Y-%m-%d")
-        
-        print("Fetching athlete data...")
-        athlete = self._intervals_get("")
-        
+        oldest_extended = (now - timedelta(days=days_for_acwr - 1)).strftime("%Y-%m-%d")
+        oldest_display = (now - timedelta(days=days_back - 1)).strftime("%Y-%m-%d")
+        newest = now.strftime("%Y-%m-%d")
+        today = newest
+        yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
+
+        # Events range: past days for Consistency Index, 90 days ahead for race calendar
+        oldest_events = oldest_display
+        newest_ahead = (now + timedelta(days=90)).strftime("%Y-%m-%d")
+
+        # The four remaining fetches have no data dependency on each other,
+        # so run them concurrently — wall time drops to roughly the slowest
+        # single call instead of the sum. The pooled Session is thread-safe.
+        print(f"Fetching athlete, activities ({days_for_acwr}d), wellness ({days_for_acwr}d), events...")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                "athlete": executor.submit(self._intervals_get, ""),
+                "activities": executor.submit(
+                    self._intervals_get, "activities",
+                    {"oldest": oldest_extended, "newest": newest}),
+                "wellness": executor.submit(
+                    self._intervals_get, "wellness",
+                    {"oldest": oldest_extended, "newest": newest}),
+                "events": executor.submit(
+                    self._intervals_get, "events",
+                    {"oldest": oldest_events, "newest": newest_ahead}),
+            }
+            results = {key: future.result() for key, future in futures.items()}
+
+        # Fetch phase done — one pruned write instead of one per store
+        self._save_etag_cache()
+
+        athlete = results["athlete"]
+        activities_extended = results["activities"]
+        wellness_extended = results["wellness"]
+        events = results["events"]
+
         cycling_settings = None
         if athlete.get("sportSettings"):
             for sport in athlete["sportSettings"]:
                 if "Ride" in sport.get("types", []) or "VirtualRide" in sport.get("types", []):
                     cycling_settings = sport
                     break
-        
-        # Fetch extended activity range for ACWR
-        print(f"Fetching activities (extended {days_for_acwr} days for ACWR)...")
-        activities_extended = self._intervals_get("activities", {"oldest": oldest_extended, "newest": newest})
-        
-        # Filter to display range for recent_activities
-        activities_display = [a for a in activities_extended 
-                             if a.get("start_date_local", "")[:10] >= oldest_display]
-        
-        print("Fetching wellness data...")
-        wellness = self._intervals_get("wellness", {"oldest": oldest_display, "newest": newest})
-        
-        # Extended wellness for baselines (use full 28 days if available)
-        wellness_extended = self._intervals_get("wellness", {"oldest": oldest_extended, "newest": newest})
-        
-        # Fetch today's wellness for live estimates (eFTP, W', P-max, VO2max, etc.)
-        print("Fetching today's wellness (eFTP, W', P-max, VO2max)...")
-        today_wellness = self._fetch_today_wellness()
-        
+
+        # Annotate each activity with its cached date/ordinal/sport keys
+        # once, then bin into the display/today views — downstream helpers
+        # read the cached keys instead of re-slicing per pass
+        self._annotate_activities(activities_extended)
+        activities_display = []
+        todays_activities = []
+        for a in activities_extended:
+            if a["_date"] >= oldest_display:
+                activities_display.append(a)
+                if a["_date"] == today:
+                    todays_activities.append(a)
+
+        # The 7-day, today and yesterday wellness views are all subsets of
+        # the 28-day range, so slice locally instead of paying extra HTTP
+        # round trips
+
+        wellness_by_date = {self._wellness_date(w): w for w in wellness_extended}
+        wellness = [w for w in wellness_extended if self._wellness_date(w) >= oldest_display]
+
+        # Today's wellness holds the live estimates (eFTP, W', P-max, VO2max, etc.)
+        today_wellness = wellness_by_date.get(today, {})
+
         # Extract power model from wellness (accurate live estimates)
         power_model = self._extract_power_model_from_wellness(today_wellness)
-        
+
         # Extract additional metrics from today's wellness
         vo2max = today_wellness.get("vo2max")
-        
+
         # Get API values for fitness metrics (these include planned workouts!)
         api_ctl = today_wellness.get("ctl")
         api_atl = today_wellness.get("atl")
         api_ramp_rate = today_wellness.get("rampRate")
-        
-        # Fetch yesterday's wellness for decay fallback
-        print("Fetching fitness metrics...")
+
+        # Yesterday's wellness for decay fallback (sliced from extended range)
+        print("Calculating fitness metrics...")
         try:
-            yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-            yesterday_wellness = self._intervals_get("wellness", {"oldest": yesterday, "newest": yesterday})
-            yesterday_data = yesterday_wellness[0] if yesterday_wellness else {}
-            
-            # PMC decay constants
-            ctl_decay = math.exp(-1/42)  # ~0.9765
-            atl_decay = math.exp(-1/7)   # ~0.8668
-            
+            yesterday_data = wellness_by_date.get(yesterday, {})
+
             yesterday_ctl = yesterday_data.get("ctl")
             yesterday_atl = yesterday_data.get("atl")
             yesterday_ramp = yesterday_data.get("rampRate")
             
             # Decayed values = what fitness looks like with zero training today
-            decayed_ctl = round(yesterday_ctl * ctl_decay, 2) if yesterday_ctl else None
-            decayed_atl = round(yesterday_atl * atl_decay, 2) if yesterday_atl else None
-            decayed_ramp = round(yesterday_ramp * ctl_decay, 2) if yesterday_ramp else None
-        except:
+            decayed_ctl = round(yesterday_ctl * self.CTL_DECAY, 2) if yesterday_ctl else None
+            decayed_atl = round(yesterday_atl * self.ATL_DECAY, 2) if yesterday_atl else None
+            decayed_ramp = round(yesterday_ramp * self.CTL_DECAY, 2) if yesterday_ramp else None
+        except (TypeError, ValueError, KeyError):
             decayed_ctl = None
             decayed_atl = None
             decayed_ramp = None
@@ -365,23 +792,29 @@ class IntervalsSync:
         
         latest_wellness = wellness[-1] if wellness else {}
         
-        # Fetch planned workouts (EXTENDED: include past 7 days for Consistency Index, 90 days ahead for race calendar)
-        print("Fetching planned workouts (past + future for Consistency Index + race calendar)...")
-        oldest_events = (datetime.now() - timedelta(days=days_back - 1)).strftime("%Y-%m-%d")
-        newest_ahead = (datetime.now() + timedelta(days=90)).strftime("%Y-%m-%d")
-        events = self._intervals_get("events", {"oldest": oldest_events, "newest": newest_ahead})
-        
-        # Split events into past (for consistency), near future (for planned workouts display), and all future (for race calendar)
-        past_events = [e for e in events if e.get("start_date_local", "")[:10] <= today]
-        future_events = [e for e in events if e.get("start_date_local", "")[:10] >= today]
-        near_future_events = [e for e in future_events if e.get("start_date_local", "")[:10] <= (datetime.now() + timedelta(days=42)).strftime("%Y-%m-%d")]
+        # Split events into past (for consistency), near future (for planned
+        # workouts display), all future (for race calendar), and today's
+        # planned workouts — one walk over the 90-day window instead of four
+        cutoff_near = (now + timedelta(days=42)).strftime("%Y-%m-%d")
+        past_events = []
+        future_events = []
+        near_future_events = []
+        todays_planned = []
+        for e in events:
+            e_date = e.get("start_date_local", "")[:10]
+            e["_date"] = e_date
+            if e_date <= today:
+                past_events.append(e)
+            if e_date >= today:
+                future_events.append(e)
+                if e_date <= cutoff_near:
+                    near_future_events.append(e)
+            if e_date == today:
+                todays_planned.append(e)
         
         # Smart fitness metrics: same logic for CTL, ATL, TSB, and ramp rate
         # API values include planned workouts → inflated if not yet completed
         # Decayed values = yesterday × decay → accurate baseline before any training today
-        todays_planned = [e for e in events if e.get("start_date_local", "")[:10] == today]
-        todays_activities = [a for a in activities_display if a.get("start_date_local", "")[:10] == today]
-        
         if todays_planned and not todays_activities:
             # Planned workouts exist but nothing completed → decay (API values are inflated)
             ctl = decayed_ctl
@@ -404,14 +837,14 @@ class IntervalsSync:
         # Load and update FTP history (tracks both indoor and outdoor)
         print("Updating FTP history...")
         ftp_history = self._load_ftp_history()
-        ftp_history = self._save_ftp_history(ftp_history, current_ftp_indoor, current_ftp_outdoor)
-        
+        ftp_history = self._save_ftp_history(ftp_history, current_ftp_indoor, current_ftp_outdoor, now=now)
+
         # Calculate Benchmark Index for both
         benchmark_index_indoor, ftp_8_weeks_ago_indoor = self._calculate_benchmark_index(
-            current_ftp_indoor, ftp_history.get("indoor", {}), "indoor"
+            current_ftp_indoor, ftp_history.get("indoor", {}), "indoor", now=now
         )
         benchmark_index_outdoor, ftp_8_weeks_ago_outdoor = self._calculate_benchmark_index(
-            current_ftp_outdoor, ftp_history.get("outdoor", {}), "outdoor"
+            current_ftp_outdoor, ftp_history.get("outdoor", {}), "outdoor", now=now
         )
         
         # Calculate derived metrics for Section 11 compliance
@@ -479,7 +912,18 @@ class IntervalsSync:
         
         # History confidence (v3.3.0)
         history_info = self._get_history_confidence()
-        
+
+        # Single pass over the display activities for the totals used by
+        # quick_stats and the summary sections (instead of three genexps
+        # plus re-walks in the summary helpers) — reads the numeric keys
+        # cached by _annotate_activities
+        total_display_seconds = 0
+        total_display_tss = 0.0
+        for act in activities_display:
+            total_display_seconds += act["_moving"]
+            total_display_tss += act["_tss"]
+        display_totals = (total_display_seconds, total_display_tss)
+
         data = {
             "READ_THIS_FIRST": {
                 "instruction_for_ai": "DO NOT calculate totals from individual activities. Use the pre-calculated values in 'summary', 'weekly_summary', and 'derived_metrics' sections below. These are already computed accurately from the API data.",
@@ -487,21 +931,21 @@ class IntervalsSync:
                 "extended_data_note": f"ACWR and baselines calculated from {days_for_acwr} days of data",
                 "capability_metrics_note": "The 'capability' block in derived_metrics contains durability trend (aggregate decoupling 7d/28d) and TID comparison (7d vs 28d distribution drift). These measure HOW the athlete expresses fitness, not just load. Use these for coaching context alongside traditional load metrics. Durability trend direction matters more than absolute values.",
                 "quick_stats": {
-                    "total_training_hours": round(sum(act.get("moving_time", 0) for act in activities_display) / 3600, 2),
+                    "total_training_hours": round(total_display_seconds / 3600, 2),
                     "total_activities": len(activities_display),
-                    "total_tss": round(sum(act.get("icu_training_load", 0) for act in activities_display if act.get("icu_training_load")), 0)
+                    "total_tss": round(total_display_tss, 0)
                 }
             },
             "metadata": {
                 "athlete_id": "REDACTED" if anonymize else self.athlete_id,
-                "last_updated": datetime.now().isoformat(),
+                "last_updated": now.isoformat(),
                 "data_range_days": days_back,
                 "extended_range_days": days_for_acwr,
                 "version": self.VERSION
             },
             "alerts": alerts,
             "history": history_info,
-            "summary": self._compute_activity_summary(activities_display, days_back),
+            "summary": self._compute_activity_summary(activities_display, days_back, totals=display_totals),
             "current_status": {
                 "fitness": {
                     "ctl": ctl,
@@ -533,7 +977,7 @@ class IntervalsSync:
             "recent_activities": self._format_activities(activities_display, anonymize),
             "wellness_data": self._format_wellness(wellness),
             "planned_workouts": self._format_events(near_future_events, anonymize),
-            "weekly_summary": self._compute_weekly_summary(activities_display, wellness),
+            "weekly_summary": self._compute_weekly_summary(activities_display, wellness, totals=display_totals),
             "race_calendar": race_calendar
         }
         
@@ -564,8 +1008,11 @@ class IntervalsSync:
         benchmark_index_outdoor, ftp_8_weeks_ago_outdoor, current_ftp_outdoor = benchmark_outdoor
         
         # === DAILY TSS AGGREGATION ===
-        daily_tss_7d = self._get_daily_tss(activities_7d, days=7)
-        daily_tss_28d = self._get_daily_tss(activities_28d, days=28)
+        # One ordinal snapshot shared by all daily aggregations — keeps
+        # the windows aligned even across a midnight rollover
+        today_ord = date.today().toordinal()
+        daily_tss_7d = self._get_daily_tss(activities_7d, days=7, today_ord=today_ord)
+        daily_tss_28d = self._get_daily_tss(activities_28d, days=28, today_ord=today_ord)
         
         tss_7d_total = sum(daily_tss_7d)
         tss_28d_total = sum(daily_tss_28d)
@@ -581,12 +1028,8 @@ class IntervalsSync:
         # Formula: mean(daily_tss) / stdev(daily_tss)
         # Reference: Foster (1998) - values >2.0 indicate increased illness risk
         if len(daily_tss_7d) > 1 and any(daily_tss_7d):
-            mean_tss = statistics.mean(daily_tss_7d)
-            try:
-                stdev_tss = statistics.stdev(daily_tss_7d)
-                monotony = round(mean_tss / stdev_tss, 2) if stdev_tss > 0 else None
-            except:
-                monotony = None
+            mean_tss, stdev_tss = self._mean_stdev(daily_tss_7d)
+            monotony = round(mean_tss / stdev_tss, 2) if stdev_tss else None
         else:
             monotony = None
             mean_tss = 0
@@ -595,28 +1038,27 @@ class IntervalsSync:
         # Multi-sport athletes get inflated total monotony when cross-training
         # adds a consistent TSS floor across days. Per-sport monotony isolates
         # the actual load variation within each modality.
-        daily_tss_by_sport = self._get_daily_tss_by_sport(activities_7d, days=7)
+        daily_tss_by_sport = self._get_daily_tss_by_sport(activities_7d, days=7, today_ord=today_ord)
         primary_sport = None
         primary_sport_monotony = None
         primary_sport_tss_7d = None
 
         if daily_tss_by_sport:
-            # Primary sport = highest 7-day TSS total
-            sport_totals = {sport: sum(days) for sport, days in daily_tss_by_sport.items()}
-            primary_sport = max(sport_totals, key=sport_totals.get) if sport_totals else None
+            # Primary sport = highest 7-day TSS total; Counter.most_common
+            # selects it in C instead of max() with a Python-level key
+            sport_totals = Counter(
+                {sport: sum(days) for sport, days in daily_tss_by_sport.items()}
+            )
+            primary_sport = sport_totals.most_common(1)[0][0]
 
             if primary_sport:
                 primary_days = daily_tss_by_sport[primary_sport]
-                primary_sport_tss_7d = round(sum(primary_days), 0)
+                primary_sport_tss_7d = round(sport_totals[primary_sport], 0)
                 # Require ≥3 active days for meaningful monotony
                 active_days = sum(1 for d in primary_days if d > 0)
                 if active_days >= 3 and len(primary_days) > 1:
-                    try:
-                        ps_mean = statistics.mean(primary_days)
-                        ps_stdev = statistics.stdev(primary_days)
-                        primary_sport_monotony = round(ps_mean / ps_stdev, 2) if ps_stdev > 0 else None
-                    except:
-                        primary_sport_monotony = None
+                    ps_mean, ps_stdev = self._mean_stdev(primary_days)
+                    primary_sport_monotony = round(ps_mean / ps_stdev, 2) if ps_stdev else None
 
                 if self.debug:
                     print(f"  Primary sport: {primary_sport} (TSS: {primary_sport_tss_7d})")
@@ -637,26 +1079,49 @@ class IntervalsSync:
         strain = round(tss_7d_total * monotony, 0) if monotony else None
         
         # === BASELINES (7-day and extended) ===
-        hrv_values_7d = [w.get("hrv") for w in wellness_7d if self._is_valid_hrv(w.get("hrv"))]
-        rhr_values_7d = [w.get("restingHR") for w in wellness_7d if w.get("restingHR")]
-        
-        hrv_baseline_7d = round(statistics.mean(hrv_values_7d), 1) if hrv_values_7d else None
-        rhr_baseline_7d = round(statistics.mean(rhr_values_7d), 1) if rhr_values_7d else None
-        
+        # wellness_7d is the date-filtered tail of wellness_extended, so
+        # one pass over the extended window feeds both sets of running
+        # sums, with the 7d accumulators gated on the window's start date.
+        # Adding wider baselines (60/90d) stays a single pass.
+        is_valid_hrv = self._is_valid_hrv
+        wellness_date = self._wellness_date
+        oldest_7d = wellness_date(wellness_7d[0]) if wellness_7d else "~"  # "~" sorts after any date
+        hrv_sum_7d = rhr_sum_7d = hrv_sum_ext = rhr_sum_ext = 0.0
+        hrv_n_7d = rhr_n_7d = hrv_n_ext = rhr_n_ext = 0
+        latest_hrv_raw = latest_rhr = None
+        for w in wellness_extended:
+            hrv = w.get("hrv")
+            hrv_ok = is_valid_hrv(hrv)
+            if hrv_ok:
+                hrv_sum_ext += hrv
+                hrv_n_ext += 1
+            rhr = w.get("restingHR")
+            if rhr:
+                rhr_sum_ext += rhr
+                rhr_n_ext += 1
+            if wellness_date(w) >= oldest_7d:
+                if hrv_ok:
+                    hrv_sum_7d += hrv
+                    hrv_n_7d += 1
+                if rhr:
+                    rhr_sum_7d += rhr
+                    rhr_n_7d += 1
+                # Last in-window iteration doubles as the "latest" lookup
+                latest_hrv_raw = hrv
+                latest_rhr = rhr
+
+        hrv_baseline_7d = round(hrv_sum_7d / hrv_n_7d, 1) if hrv_n_7d else None
+        rhr_baseline_7d = round(rhr_sum_7d / rhr_n_7d, 1) if rhr_n_7d else None
+
         # Extended baselines (for more stable reference)
-        hrv_values_ext = [w.get("hrv") for w in wellness_extended if self._is_valid_hrv(w.get("hrv"))]
-        rhr_values_ext = [w.get("restingHR") for w in wellness_extended if w.get("restingHR")]
-        
-        hrv_baseline_28d = round(statistics.mean(hrv_values_ext), 1) if hrv_values_ext else None
-        rhr_baseline_28d = round(statistics.mean(rhr_values_ext), 1) if rhr_values_ext else None
-        
+        hrv_baseline_28d = round(hrv_sum_ext / hrv_n_ext, 1) if hrv_n_ext else None
+        rhr_baseline_28d = round(rhr_sum_ext / rhr_n_ext, 1) if rhr_n_ext else None
+
         # === RECOVERY INDEX (RI) ===
         # Formula: (HRV_today / HRV_baseline) ÷ (RHR_today / RHR_baseline)
         # Interpretation: >1.0 = good recovery, <1.0 = poor recovery
-        latest_hrv_raw = wellness_7d[-1].get("hrv") if wellness_7d else None
-        latest_hrv = latest_hrv_raw if self._is_valid_hrv(latest_hrv_raw) else None
-        latest_rhr = wellness_7d[-1].get("restingHR") if wellness_7d else None
-        
+        latest_hrv = latest_hrv_raw if is_valid_hrv(latest_hrv_raw) else None
+
         if latest_hrv and latest_rhr and hrv_baseline_7d and rhr_baseline_7d:
             hrv_ratio = latest_hrv / hrv_baseline_7d
             rhr_ratio = latest_rhr / rhr_baseline_7d
@@ -681,30 +1146,29 @@ class IntervalsSync:
         z3_time = zone_totals["z3_time"]
         z4_plus_time = zone_totals["z4_plus_time"]
         
-        # === GREY ZONE PERCENTAGE (Z3 - to be minimized in polarized training) ===
-        # Reference: Seiler - "too much pain for too little gain"
-        grey_zone_percentage = round((z3_time / total_zone_time) * 100, 1) if total_zone_time > 0 else None
-        
-        # === QUALITY INTENSITY PERCENTAGE (Z4+ per Seiler's model) ===
-        # Reference: Seiler's Zone 3 = above LT2 = Z4+ in 7-zone model
-        # This is the "hard" work that should be ~20% in polarized training
-        quality_intensity_percentage = round((z4_plus_time / total_zone_time) * 100, 1) if total_zone_time > 0 else None
-        
-        # === POLARISATION INDEX ===
-        # Formula: (Z1 + Z2) / Total - measures how much time is "easy"
-        # Target: ~80% for polarized training
-        polarisation_index = round((z1_time + z2_time) / total_zone_time, 2) if total_zone_time > 0 else None
+        # === ZONE PERCENTAGES ===
+        # One guard and one division for the whole triplet:
+        # - Grey zone % (Z3): minimize per Seiler - "too much pain for too
+        #   little gain"
+        # - Quality intensity % (Z4+ = Seiler's Zone 3, above LT2): the
+        #   "hard" work that should be ~20% in polarized training
+        # - Polarisation index: (Z1 + Z2) / Total easy time, target ~80%
+        if total_zone_time > 0:
+            inv_pct = 100.0 / total_zone_time
+            grey_zone_percentage = round(z3_time * inv_pct, 1)
+            quality_intensity_percentage = round(z4_plus_time * inv_pct, 1)
+            polarisation_index = round((z1_time + z2_time) / total_zone_time, 2)
+        else:
+            grey_zone_percentage = quality_intensity_percentage = polarisation_index = None
+        inv_hour = 1.0 / 3600  # seconds -> hours for the zone_distribution_7d block
         
         # === SEILER TID (Training Intensity Distribution) ===
         # Dual calculation: all-sport and primary-sport (like monotony)
         # Uses correct 7→3 zone mapping per Treff et al. 2019
-        seiler_tid_all = self._build_seiler_tid(activities_7d)
-
-        seiler_tid_primary = None
-        if primary_sport:
-            seiler_tid_primary = self._build_seiler_tid(
-                activities_7d, sport_family_filter=primary_sport
-            )
+        seiler_tid_all, seiler_tid_primary = self._build_seiler_tids(
+            activities_7d, primary_sport
+        )
+        if seiler_tid_primary:
             seiler_tid_primary["sport"] = primary_sport
 
         if self.debug:
@@ -718,13 +1182,10 @@ class IntervalsSync:
 
         # === SEILER TID 28d (Chronic Training Intensity Distribution) ===
         # Same method, wider window — for acute vs chronic TID comparison
-        seiler_tid_28d_all = self._build_seiler_tid(activities_28d)
-
-        seiler_tid_28d_primary = None
-        if primary_sport:
-            seiler_tid_28d_primary = self._build_seiler_tid(
-                activities_28d, sport_family_filter=primary_sport
-            )
+        seiler_tid_28d_all, seiler_tid_28d_primary = self._build_seiler_tids(
+            activities_28d, primary_sport
+        )
+        if seiler_tid_28d_primary:
             seiler_tid_28d_primary["sport"] = primary_sport
 
         if self.debug:
@@ -747,46 +1208,25 @@ class IntervalsSync:
         # Zone ladder with cumulative thresholds (z+ = zone + all above)
         # z3+ >= 1800s, z4+ >= 600s, z5+ >= 300s, z6+ >= 120s, z7 >= 60s
         # Per Seiler's polarized model + Foster's session RPE scaling
-        hard_days_this_week = 0
-        activities_by_date_7d = {}
+        # Accumulate per-day z3..z7 seconds in one pass (no interim
+        # date→activity-list grouping, no second scan over the activities)
+        day_zones = defaultdict(lambda: [0, 0, 0, 0, 0])  # z3..z7 seconds
         for a in activities_7d:
-            a_date = a.get("start_date_local", "")[:10]
-            if a_date not in activities_by_date_7d:
-                activities_by_date_7d[a_date] = []
-            activities_by_date_7d[a_date].append(a)
-        
-        for date_str, day_acts in activities_by_date_7d.items():
-            day_z3 = 0
-            day_z4 = 0
-            day_z5 = 0
-            day_z6 = 0
-            day_z7 = 0
-            for a in day_acts:
-                icu_zone_times = a.get("icu_zone_times", [])
-                if icu_zone_times:
-                    for zone in icu_zone_times:
-                        zid = zone.get("id", "").lower()
-                        secs = zone.get("secs", 0)
-                        if zid == "z3":
-                            day_z3 += secs
-                        elif zid == "z4":
-                            day_z4 += secs
-                        elif zid == "z5":
-                            day_z5 += secs
-                        elif zid == "z6":
-                            day_z6 += secs
-                        elif zid == "z7":
-                            day_z7 += secs
-            # Zone ladder: cumulative thresholds (z+ = zone + all above)
-            # Per Seiler's polarized model + Foster's session RPE scaling
-            is_hard = (
-                (day_z3 + day_z4 + day_z5 + day_z6 + day_z7) >= 1800 or  # z3+: 30 min tempo+
-                (day_z4 + day_z5 + day_z6 + day_z7) >= 600 or            # z4+: 10 min threshold+
-                (day_z5 + day_z6 + day_z7) >= 300 or                      # z5+: 5 min VO2max+
-                (day_z6 + day_z7) >= 120 or                                # z6+: 2 min anaerobic+
-                day_z7 >= 60                                                # z7:  1 min neuromuscular
-            )
-            if is_hard:
+            icu_zone_times = a.get("icu_zone_times")
+            if not icu_zone_times:
+                continue
+            dz = day_zones[a["_date"]]
+            for zone in icu_zone_times:
+                zid = zone.get("id", "")
+                if len(zid) == 2 and zid[0] in "zZ":
+                    idx = ord(zid[1]) - 51  # 'z3' -> 0 ... 'z7' -> 4
+                    if 0 <= idx < 5:
+                        dz[idx] += zone.get("secs", 0)
+
+        hard_days_this_week = 0
+        is_hard_day = self._is_hard_day
+        for day_z3, day_z4, day_z5, day_z6, day_z7 in day_zones.values():
+            if is_hard_day(day_z3, day_z4, day_z5, day_z6, day_z7):
                 hard_days_this_week += 1
         
         # === PHASE DETECTION ===
@@ -807,7 +1247,32 @@ class IntervalsSync:
         # === BENCHMARK SEASONAL EXPECTATION ===
         benchmark_expected_indoor = self._is_benchmark_expected(benchmark_index_indoor, seasonal_context)
         benchmark_expected_outdoor = self._is_benchmark_expected(benchmark_index_outdoor, seasonal_context)
-        
+
+        # Materialize the nested sub-dicts before the return so the final
+        # literal stays flat (Seiler's Polarized Model zone distribution
+        # and the indoor/outdoor FTP benchmark blocks)
+        zone_distribution_7d = {
+            "z1_hours": round(z1_time * inv_hour, 2),
+            "z2_hours": round(z2_time * inv_hour, 2),
+            "z3_hours": round(z3_time * inv_hour, 2),
+            "z4_plus_hours": round(z4_plus_time * inv_hour, 2),
+            "total_hours": round(total_zone_time * inv_hour, 2)
+        }
+        benchmark_indoor_block = {
+            "current_ftp": current_ftp_indoor,
+            "ftp_8_weeks_ago": ftp_8_weeks_ago_indoor,
+            "benchmark_index": benchmark_index_indoor,
+            "benchmark_percentage": _fmt_pct(benchmark_index_indoor),
+            "seasonal_expected": benchmark_expected_indoor
+        }
+        benchmark_outdoor_block = {
+            "current_ftp": current_ftp_outdoor,
+            "ftp_8_weeks_ago": ftp_8_weeks_ago_outdoor,
+            "benchmark_index": benchmark_index_outdoor,
+            "benchmark_percentage": _fmt_pct(benchmark_index_outdoor),
+            "seasonal_expected": benchmark_expected_outdoor
+        }
+
         return {
             # Tier 1: Primary Readiness
             "recovery_index": ri,
@@ -835,13 +1300,7 @@ class IntervalsSync:
             "tss_28d_total": round(tss_28d_total, 0),
             
             # Tier 3: Zone Distribution (Seiler's Polarized Model)
-            "zone_distribution_7d": {
-                "z1_hours": round(z1_time / 3600, 2),
-                "z2_hours": round(z2_time / 3600, 2),
-                "z3_hours": round(z3_time / 3600, 2),
-                "z4_plus_hours": round(z4_plus_time / 3600, 2),
-                "total_hours": round(total_zone_time / 3600, 2)
-            },
+            "zone_distribution_7d": zone_distribution_7d,
             "grey_zone_percentage": grey_zone_percentage,
             "grey_zone_note": "Gray Zone % (Z3/tempo) - minimize in polarized training",
             "quality_intensity_percentage": quality_intensity_percentage,
@@ -872,22 +1331,9 @@ class IntervalsSync:
             "phase_triggers": phase_triggers,
             "seasonal_context": seasonal_context,
             
-            # Benchmark & FTP Progression (Indoor)
-            "benchmark_indoor": {
-                "current_ftp": current_ftp_indoor,
-                "ftp_8_weeks_ago": ftp_8_weeks_ago_indoor,
-                "benchmark_index": benchmark_index_indoor,
-                "benchmark_percentage": f"{benchmark_index_indoor:+.1%}" if benchmark_index_indoor is not None else None,
-                "seasonal_expected": benchmark_expected_indoor
-            },
-            # Benchmark & FTP Progression (Outdoor)
-            "benchmark_outdoor": {
-                "current_ftp": current_ftp_outdoor,
-                "ftp_8_weeks_ago": ftp_8_weeks_ago_outdoor,
-                "benchmark_index": benchmark_index_outdoor,
-                "benchmark_percentage": f"{benchmark_index_outdoor:+.1%}" if benchmark_index_outdoor is not None else None,
-                "seasonal_expected": benchmark_expected_outdoor
-            },
+            # Benchmark & FTP Progression (Indoor / Outdoor)
+            "benchmark_indoor": benchmark_indoor_block,
+            "benchmark_outdoor": benchmark_outdoor_block,
             
             # Power Model (from API - accurate live estimates)
             "eftp": power_model.get("eftp"),
@@ -902,8 +1348,8 @@ class IntervalsSync:
             # Validation metadata
             "calculation_timestamp": datetime.now().isoformat(),
             "data_quality": {
-                "hrv_data_points": len(hrv_values_7d),
-                "rhr_data_points": len(rhr_values_7d),
+                "hrv_data_points": hrv_n_7d,
+                "rhr_data_points": rhr_n_7d,
                 "activities_7d": len(activities_7d),
                 "activities_28d": len(activities_28d),
                 "planned_workouts_7d": len(past_events),
@@ -915,14 +1361,10 @@ class IntervalsSync:
         """Interpret ACWR value per Gabbett guidelines"""
         if acwr is None:
             return None
-        if acwr < 0.8:
-            return "undertraining"
-        elif acwr <= 1.3:
-            return "optimal"
-        elif acwr <= 1.5:
-            return "caution"
-        else:
-            return "danger"
+        if acwr < self._ACWR_THRESHOLDS[0]:
+            return self._ACWR_LABELS[0]
+        # lo=1 keeps the remaining bounds inclusive (<=1.3 optimal, <=1.5 caution)
+        return self._ACWR_LABELS[bisect.bisect_left(self._ACWR_THRESHOLDS, acwr, 1)]
 
     def _interpret_monotony(self, total_monotony: float, effective_monotony: float, is_multi_sport: bool) -> Optional[str]:
         """
@@ -952,22 +1394,18 @@ class IntervalsSync:
         Matches by date (not individual workouts) since multiple workouts can be planned per day.
         """
         # Get unique dates with planned workouts (only WORKOUT type)
-        planned_dates = set()
-        for event in past_events:
-            if event.get("category") == "WORKOUT":
-                date_str = event.get("start_date_local", "")[:10]
-                if date_str:
-                    planned_dates.add(date_str)
-        
+        planned_dates = {
+            event.get("start_date_local", "")[:10]
+            for event in past_events
+            if event.get("category") == "WORKOUT" and event.get("start_date_local")
+        }
+
         # Get unique dates with completed activities (cycling only for fair comparison)
-        completed_dates = set()
-        cycling_types = {"Ride", "VirtualRide", "MountainBikeRide", "GravelRide"}
-        
-        for activity in activities:
-            if activity.get("type") in cycling_types:
-                date_str = activity.get("start_date_local", "")[:10]
-                if date_str:
-                    completed_dates.add(date_str)
+        completed_dates = {
+            activity["_date"]
+            for activity in activities
+            if activity["_sport_family"] == "cycling" and activity["_date"]
+        }
         
         # Calculate overlap
         matched_dates = planned_dates & completed_dates
@@ -997,20 +1435,12 @@ class IntervalsSync:
         """
         if benchmark_index is None:
             return None
-        
-        expectations = {
-            "Off-season / Transition": (-0.05, -0.02),
-            "Early Base": (-0.02, 0.01),
-            "Late Base / Build": (0.02, 0.05),
-            "Build / Early Race Season": (0.01, 0.04),
-            "Peak Race Season": (0.01, 0.03),
-            "Late Season / Transition": (-0.03, 0.00),
-        }
-        
-        if seasonal_context in expectations:
-            low, high = expectations[seasonal_context]
+
+        expected = self._BENCHMARK_EXPECTATIONS.get(seasonal_context)
+        if expected is not None:
+            low, high = expected
             return low <= benchmark_index <= high
-        
+
         return None
     
     def _get_ftp_history_span(self) -> Dict[str, int]:
@@ -1021,40 +1451,61 @@ class IntervalsSync:
         
         for ftp_type in ["indoor", "outdoor"]:
             history = ftp_history.get(ftp_type, {})
-            if not history:
+            if len(history) < 2:
                 continue
-            
-            sorted_dates = sorted(history.keys())
-            if len(sorted_dates) < 2:
-                continue
-            
+
+            # min/max instead of a full sort — only the span endpoints
+            # matter — and fromisoformat's C parser for the fixed format
             try:
-                oldest = datetime.strptime(sorted_dates[0], "%Y-%m-%d")
-                newest = datetime.strptime(sorted_dates[-1], "%Y-%m-%d")
+                oldest = date.fromisoformat(min(history))
+                newest = date.fromisoformat(max(history))
                 result[ftp_type] = (newest - oldest).days
-            except:
+            except ValueError:
                 continue
         
         return result
     
-    def _get_daily_tss(self, activities: List[Dict], days: int) -> List[float]:
-        """Aggregate TSS by day for the specified number of days"""
-        daily_tss = defaultdict(float)
-        
+    @staticmethod
+    def _mean_stdev(values: List[float]) -> Tuple[float, Optional[float]]:
+        """
+        Mean and sample standard deviation of a small numeric list.
+
+        Plain float math: statistics.mean/stdev go through exact-fraction
+        arithmetic, which is far slower than needed for TSS-scale inputs.
+        Returns (mean, stdev); stdev is None when fewer than 2 values.
+        """
+        n = len(values)
+        mean = sum(values) / n
+        if n < 2:
+            return mean, None
+        variance = sum((v - mean) ** 2 for v in values) / (n - 1)
+        return mean, math.sqrt(variance)
+
+    def _get_daily_tss(self, activities: List[Dict], days: int,
+                       today_ord: int = None) -> List[float]:
+        """
+        Aggregate TSS by day for the specified number of days.
+        Expects activities annotated by _annotate_activities.
+        """
+        # Bincount-style accumulation: each activity's cached day ordinal
+        # maps to an integer offset from today, added straight into the
+        # output array — no per-day strftime loop and no date-keyed dict
+        if today_ord is None:
+            today_ord = date.today().toordinal()
+        result = [0.0] * days
+
         for act in activities:
-            date_str = act.get("start_date_local", "")[:10]
-            tss = act.get("icu_training_load") or 0
-            daily_tss[date_str] += tss
-        
-        # Create array for last N days (including days with 0 TSS)
-        result = []
-        for i in range(days - 1, -1, -1):
-            date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-            result.append(daily_tss.get(date, 0))
-        
+            day_ord = act["_day_ord"]
+            if day_ord is None:
+                continue
+            day_off = today_ord - day_ord
+            if 0 <= day_off < days:
+                result[days - 1 - day_off] += act["_tss"]
+
         return result
 
-    def _get_daily_tss_by_sport(self, activities: List[Dict], days: int) -> Dict[str, List[float]]:
+    def _get_daily_tss_by_sport(self, activities: List[Dict], days: int,
+                                today_ord: int = None) -> Dict[str, List[float]]:
         """
         Aggregate TSS by day AND sport family for per-sport monotony calculation.
         Returns dict of sport_family → [daily_tss_day1, daily_tss_day2, ...] (N elements).
@@ -1062,28 +1513,26 @@ class IntervalsSync:
         Sport families are mapped via SPORT_FAMILIES class constant.
         Unmapped activity types are grouped as "other".
         """
-        # Collect all sport families present and their daily TSS
-        sport_daily_tss = defaultdict(lambda: defaultdict(float))
+        # Bincount-style accumulation into per-sport daily arrays keyed by
+        # integer day offset — a defaultdict factory creates the zeroed
+        # array on first touch, no second pass and no per-day strftime.
+        # Expects activities annotated by _annotate_activities.
+        if today_ord is None:
+            today_ord = date.today().toordinal()
+        result = defaultdict(lambda: [0.0] * days)
 
         for act in activities:
-            date_str = act.get("start_date_local", "")[:10]
-            tss = act.get("icu_training_load") or 0
+            tss = act["_tss"]
             if tss <= 0:
                 continue
-            activity_type = act.get("type", "Unknown")
-            sport_family = self.SPORT_FAMILIES.get(activity_type, "other")
-            sport_daily_tss[sport_family][date_str] += tss
-
-        # Build daily arrays for each sport family (including 0 days)
-        result = {}
-        for sport_family, daily_dict in sport_daily_tss.items():
-            daily_array = []
-            for i in range(days - 1, -1, -1):
-                date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-                daily_array.append(daily_dict.get(date, 0))
-            result[sport_family] = daily_array
+            day_ord = act["_day_ord"]
+            if day_ord is None:
+                continue
+            day_off = today_ord - day_ord
+            if 0 <= day_off < days:
+                result[act["_sport_family"]][days - 1 - day_off] += tss
 
-        return result
+        return dict(result)
 
     def _aggregate_zones(self, activities: List[Dict]) -> Dict:
         """
@@ -1100,43 +1549,37 @@ class IntervalsSync:
         z3_time = 0
         z4_plus_time = 0
         total_time = 0
-        
+
         for act in activities:
-            zones = None
-            
-            # Check for zone data in raw activity
-            icu_zone_times = act.get("icu_zone_times", [])
-            icu_hr_zone_times = act.get("icu_hr_zone_times", [])
-            
-            # Power zones (preferred for cycling)
-            if icu_zone_times:
-                pz = {}
-                for zone in icu_zone_times:
-                    zone_id = zone.get("id", "").lower()
-                    secs = zone.get("secs", 0)
-                    if zone_id in ["z1", "z2", "z3", "z4", "z5", "z6", "z7"]:
-                        pz[zone_id] = secs
-                if pz:
-                    zones = pz
-            
+            # Fixed-index accumulator instead of a throwaway string-keyed
+            # dict — "zN" maps to index N-1 via the digit's ordinal
+            zt = [0] * 7
+            have_zones = False
+
+            # Power zones (preferred for cycling) — the API sends an
+            # explicit null when there is no power data, so `or []`
+            for zone in act.get("icu_zone_times") or []:
+                zid = zone.get("id", "")
+                if len(zid) == 2 and zid[0] in "zZ":
+                    idx = ord(zid[1]) - 49  # '1' -> 0 ... '7' -> 6
+                    if 0 <= idx < 7:
+                        zt[idx] += zone.get("secs", 0)
+                        have_zones = True
+
             # HR zones (fallback)
-            if not zones and icu_hr_zone_times:
-                zone_labels = ["z1", "z2", "z3", "z4", "z5", "z6", "z7"]
-                hz = {}
-                for idx, secs in enumerate(icu_hr_zone_times):
-                    if idx < len(zone_labels) and secs:
-                        hz[zone_labels[idx]] = secs
-                if hz:
-                    zones = hz
-            
-            if zones:
-                z1_time += zones.get("z1", 0)
-                z2_time += zones.get("z2", 0)
-                z3_time += zones.get("z3", 0)
-                z4_plus_time += (zones.get("z4", 0) + zones.get("z5", 0) + 
-                               zones.get("z6", 0) + zones.get("z7", 0))
-                total_time += sum(zones.values())
-        
+            if not have_zones:
+                for idx, secs in enumerate((act.get("icu_hr_zone_times") or [])[:7]):
+                    if secs:
+                        zt[idx] += secs
+                        have_zones = True
+
+            if have_zones:
+                z1_time += zt[0]
+                z2_time += zt[1]
+                z3_time += zt[2]
+                z4_plus_time += zt[3] + zt[4] + zt[5] + zt[6]
+                total_time += sum(zt)
+
         return {
             "z1_time": z1_time,
             "z2_time": z2_time,
@@ -1147,10 +1590,11 @@ class IntervalsSync:
     
     # === SEILER TID (Training Intensity Distribution) v3.4.0 ===
 
-    def _aggregate_seiler_zones(self, activities: List[Dict],
-                                sport_family_filter: str = None) -> Dict:
+    def _aggregate_seiler_zones_multi(self, activities: List[Dict],
+                                      primary_sport: str = None) -> Tuple[Dict, Optional[Dict]]:
         """
-        Aggregate 7-zone times into Seiler 3-zone model.
+        Aggregate 7-zone times into Seiler 3-zone model — all sports and,
+        optionally, the primary sport — in a single pass.
 
         Mapping (per Treff et al. 2019):
             Seiler Z1 = z1 + z2  (below LT1)
@@ -1160,62 +1604,71 @@ class IntervalsSync:
         Uses power zones when available, falls back to HR zones.
 
         Args:
-            activities: List of activity dicts with zone data
-            sport_family_filter: If set, only include activities matching
-                                 this sport family (from SPORT_FAMILIES)
+            activities: Activities annotated by _annotate_activities
+            primary_sport: If set, also accumulate a second total gated
+                           on the activity's _sport_family
 
-        Returns dict with z1_seconds, z2_seconds, z3_seconds, total_seconds
+        Returns (all_zones, primary_zones); each a dict with z1_seconds,
+        z2_seconds, z3_seconds, total_seconds. primary_zones is None
+        when primary_sport is not given.
         """
-        sz1 = 0
-        sz2 = 0
-        sz3 = 0
+        sz1 = sz2 = sz3 = 0
+        pz1 = pz2 = pz3 = 0
 
         for act in activities:
-            # Apply sport family filter if specified
-            if sport_family_filter:
-                activity_type = act.get("type", "Unknown")
-                if self.SPORT_FAMILIES.get(activity_type, "other") != sport_family_filter:
-                    continue
-
-            zones = None
-
-            # Power zones (preferred)
-            icu_zone_times = act.get("icu_zone_times", [])
-            if icu_zone_times:
-                pz = {}
-                for zone in icu_zone_times:
-                    zone_id = zone.get("id", "").lower()
-                    secs = zone.get("secs", 0)
-                    if zone_id in ["z1", "z2", "z3", "z4", "z5", "z6", "z7"]:
-                        pz[zone_id] = secs
-                if pz:
-                    zones = pz
+            # Fixed-index accumulator (see _aggregate_zones) — no
+            # intermediate string-keyed dict per activity
+            zt = [0] * 7
+            have_zones = False
+
+            # Power zones (preferred) — `or []` because the API sends
+            # an explicit null when there is no power data
+            for zone in act.get("icu_zone_times") or []:
+                zid = zone.get("id", "")
+                if len(zid) == 2 and zid[0] in "zZ":
+                    idx = ord(zid[1]) - 49  # '1' -> 0 ... '7' -> 6
+                    if 0 <= idx < 7:
+                        zt[idx] += zone.get("secs", 0)
+                        have_zones = True
 
             # HR zones (fallback)
-            if not zones:
-                icu_hr_zone_times = act.get("icu_hr_zone_times", [])
-                if icu_hr_zone_times:
-                    zone_labels = ["z1", "z2", "z3", "z4", "z5", "z6", "z7"]
-                    hz = {}
-                    for idx, secs in enumerate(icu_hr_zone_times):
-                        if idx < len(zone_labels) and secs:
-                            hz[zone_labels[idx]] = secs
-                    if hz:
-                        zones = hz
-
-            if zones:
-                sz1 += zones.get("z1", 0) + zones.get("z2", 0)
-                sz2 += zones.get("z3", 0)
-                sz3 += (zones.get("z4", 0) + zones.get("z5", 0) +
-                        zones.get("z6", 0) + zones.get("z7", 0))
-
-        total = sz1 + sz2 + sz3
-        return {
+            if not have_zones:
+                for idx, secs in enumerate((act.get("icu_hr_zone_times") or [])[:7]):
+                    if secs:
+                        zt[idx] += secs
+                        have_zones = True
+
+            if have_zones:
+                a1 = zt[0] + zt[1]
+                a2 = zt[2]
+                a3 = zt[3] + zt[4] + zt[5] + zt[6]
+                sz1 += a1
+                sz2 += a2
+                sz3 += a3
+                # Single comparison gates the primary accumulators; a
+                # None primary_sport never matches a sport family, so no
+                # extra per-activity truthiness branch is needed
+                if act["_sport_family"] == primary_sport:
+                    pz1 += a1
+                    pz2 += a2
+                    pz3 += a3
+
+        all_zones = {
             "z1_seconds": sz1,
             "z2_seconds": sz2,
             "z3_seconds": sz3,
-            "total_seconds": total
+            "total_seconds": sz1 + sz2 + sz3
+        }
+        if not primary_sport:
+            return all_zones, None
+
+        primary_zones = {
+            "z1_seconds": pz1,
+            "z2_seconds": pz2,
+            "z3_seconds": pz3,
+            "total_seconds": pz1 + pz2 + pz3
         }
+        return all_zones, primary_zones
 
     def _calculate_polarization_index(self, z1_frac: float, z2_frac: float,
                                        z3_frac: float) -> Optional[float]:
@@ -1237,13 +1690,12 @@ class IntervalsSync:
         # Handle Z2 = 0 with substitution (per updated PI formulation)
         effective_z2 = z2_frac if z2_frac > 0 else 0.01
 
-        try:
-            raw = (z1_frac / effective_z2) * z3_frac * 100
-            if raw <= 0:
-                return None
-            return round(math.log10(raw), 2)
-        except (ValueError, ZeroDivisionError):
+        # effective_z2 > 0 and the raw > 0 check make the division and
+        # log10 safe by construction — no try/except setup on this path
+        raw = (z1_frac / effective_z2) * z3_frac * 100
+        if raw <= 0:
             return None
+        return round(math.log10(raw), 2)
 
     def _classify_tid(self, z1_frac: float, z2_frac: float,
                       z3_frac: float, pi: Optional[float]) -> str:
@@ -1280,10 +1732,25 @@ class IntervalsSync:
         # Fallback: polarized structure but PI <= 2.0
         return "Pyramidal"
 
-    def _build_seiler_tid(self, activities: List[Dict],
-                          sport_family_filter: str = None) -> Dict:
+    def _build_seiler_tids(self, activities: List[Dict],
+                           primary_sport: str = None) -> Tuple[Dict, Optional[Dict]]:
+        """
+        Build Seiler TID structures for all sports and the primary sport
+        from one pass over the activities (see _aggregate_seiler_zones_multi).
+
+        Returns (tid_all, tid_primary); tid_primary is None when no
+        primary_sport is given.
+        """
+        all_zones, primary_zones = self._aggregate_seiler_zones_multi(
+            activities, primary_sport
+        )
+        tid_all = self._tid_from_zones(all_zones)
+        tid_primary = self._tid_from_zones(primary_zones) if primary_zones else None
+        return tid_all, tid_primary
+
+    def _tid_from_zones(self, zones: Dict) -> Dict:
         """
-        Build complete Seiler TID structure for given activities.
+        Build complete Seiler TID structure from aggregated Seiler zones.
 
         Returns dict with:
             z1_seconds, z2_seconds, z3_seconds
@@ -1291,7 +1758,6 @@ class IntervalsSync:
             polarization_index (float or null)
             classification (string)
         """
-        zones = self._aggregate_seiler_zones(activities, sport_family_filter)
         total = zones["total_seconds"]
 
         if total == 0:
@@ -1341,36 +1807,43 @@ class IntervalsSync:
         Negative decoupling is included — it indicates HR drifted down
         relative to power (strong durability or cooling conditions).
 
+        The 7d window is the date-filtered subset of the 28d window, so
+        one pass over activities_28d feeds both sets of accumulators —
+        no interim value lists and no re-scan per statistic.
+
         Returns dict with 7d/28d means, high-drift counts, qualifying
         session counts, and trend direction.
         """
-        def _filter_qualifying(activities: List[Dict]) -> List[float]:
-            """Return decoupling values from qualifying sessions."""
-            qualifying = []
-            for act in activities:
-                # Raw API field names (before _format_activities)
-                dec = act.get("icu_hr_decoupling") or act.get("decoupling")
-                vi = act.get("icu_variability_index")
-                mt = act.get("moving_time", 0) or 0
-
-                if (dec is not None
-                        and vi is not None
-                        and vi > 0
-                        and vi <= 1.05
-                        and mt >= 5400):
-                    qualifying.append(dec)
-            return qualifying
-
-        vals_7d = _filter_qualifying(activities_7d)
-        vals_28d = _filter_qualifying(activities_28d)
-
-        # Compute means (need >= 2 qualifying sessions)
-        mean_7d = round(statistics.mean(vals_7d), 2) if len(vals_7d) >= 2 else None
-        mean_28d = round(statistics.mean(vals_28d), 2) if len(vals_28d) >= 2 else None
-
-        # High drift counts (> 5%)
-        high_drift_7d = sum(1 for v in vals_7d if v > 5.0)
-        high_drift_28d = sum(1 for v in vals_28d if v > 5.0)
+        cutoff_7d = min(a["_date"] for a in activities_7d) if activities_7d else "~"
+
+        n_7d = n_28d = high_drift_7d = high_drift_28d = 0
+        sum_7d = sum_28d = 0.0
+        for act in activities_28d:
+            # Raw API field names (before _format_activities)
+            dec = act.get("icu_hr_decoupling") or act.get("decoupling")
+            if dec is None:
+                continue
+            vi = act.get("icu_variability_index")
+            if vi is None or vi <= 0 or vi > 1.05:
+                continue
+            if act["_moving"] < 5400:
+                continue
+
+            high = dec > 5.0
+            n_28d += 1
+            sum_28d += dec
+            if high:
+                high_drift_28d += 1
+            if act["_date"] >= cutoff_7d:
+                n_7d += 1
+                sum_7d += dec
+                if high:
+                    high_drift_7d += 1
+
+        # Compute means (need >= 2 qualifying sessions); plain sum/count —
+        # statistics.mean's exact-fraction arithmetic is wasted on floats
+        mean_7d = round(sum_7d / n_7d, 2) if n_7d >= 2 else None
+        mean_28d = round(sum_28d / n_28d, 2) if n_28d >= 2 else None
 
         # Trend (requires both windows)
         trend = None
@@ -1384,16 +1857,16 @@ class IntervalsSync:
                 trend = "stable"
 
         if self.debug:
-            print(f"  Durability: 7d={mean_7d} ({len(vals_7d)} sessions), "
-                  f"28d={mean_28d} ({len(vals_28d)} sessions), trend={trend}")
+            print(f"  Durability: 7d={mean_7d} ({n_7d} sessions), "
+                  f"28d={mean_28d} ({n_28d} sessions), trend={trend}")
 
         return {
             "mean_decoupling_7d": mean_7d,
             "mean_decoupling_28d": mean_28d,
             "high_drift_count_7d": high_drift_7d,
             "high_drift_count_28d": high_drift_28d,
-            "qualifying_sessions_7d": len(vals_7d),
-            "qualifying_sessions_28d": len(vals_28d),
+            "qualifying_sessions_7d": n_7d,
+            "qualifying_sessions_28d": n_28d,
             "trend": trend,
             "note": ("Steady-state power sessions only (VI <= 1.05, VI > 0, "
                      ">= 90min, power data). Negative decoupling = strong "
@@ -1418,24 +1891,25 @@ class IntervalsSync:
         pi_7d = seiler_tid_7d.get("polarization_index")
         pi_28d = seiler_tid_28d.get("polarization_index")
 
+        # Single result shape shared by the null and normal paths —
+        # only pi_delta/drift/note differ between the two
+        result = {
+            "classification_7d": cls_7d,
+            "classification_28d": cls_28d,
+            "pi_7d": pi_7d,
+            "pi_28d": pi_28d,
+            "pi_delta": None,
+            "drift": None,
+            "note": _TID_NOTE_INSUFFICIENT
+        }
+
         # Null handling: if either window has no data, no comparison
         if cls_7d is None or cls_28d is None:
-            return {
-                "classification_7d": cls_7d,
-                "classification_28d": cls_28d,
-                "pi_7d": pi_7d,
-                "pi_28d": pi_28d,
-                "pi_delta": None,
-                "drift": None,
-                "note": ("Compares 7d vs 28d Seiler TID to detect "
-                         "distribution shifts. Insufficient data in "
-                         "one or both windows.")
-            }
+            return result
 
         # PI delta (positive = more polarized acutely)
-        pi_delta = None
         if pi_7d is not None and pi_28d is not None:
-            pi_delta = round(pi_7d - pi_28d, 2)
+            result["pi_delta"] = round(pi_7d - pi_28d, 2)
 
         # Drift classification
         # Check acute_depolarization first (more specific than shifting)
@@ -1451,17 +1925,9 @@ class IntervalsSync:
             print(f"  TID comparison: 7d={cls_7d} (PI={pi_7d}), "
                   f"28d={cls_28d} (PI={pi_28d}), drift={drift}")
 
-        return {
-            "classification_7d": cls_7d,
-            "classification_28d": cls_28d,
-            "pi_7d": pi_7d,
-            "pi_28d": pi_28d,
-            "pi_delta": pi_delta,
-            "drift": drift,
-            "note": ("Compares 7d vs 28d Seiler TID to detect "
-                     "distribution shifts. pi_delta positive = "
-                     "more polarized acutely.")
-        }
+        result["drift"] = drift
+        result["note"] = _TID_NOTE_OK
+        return result
 
     def _detect_phase(self, acwr: float, ri: float, quality_intensity_pct: float,
                       hard_days_per_week: int,
@@ -1473,19 +1939,24 @@ class IntervalsSync:
         For high-volume athletes (10+ hrs/week), time-based metrics undercount intensity
         because hard sessions are diluted by volume. Session count provides the correction.
         """
-        triggers = []
-        
-        # Check for Overreached first (safety)
-        if acwr and acwr > 1.3:
-            triggers.append(f"ACWR {acwr} > 1.3")
-        if strain and strain > 3500:
-            triggers.append(f"Strain {strain} > 3500")
-        if ri and ri < 0.6:
-            triggers.append(f"RI {ri} < 0.6")
-        if monotony and monotony > 2.5:
-            triggers.append(f"Monotony {monotony} > 2.5")
-        
-        if len(triggers) >= 2 or (ri and ri < 0.6):
+        # Check for Overreached first (safety). Evaluate the conditions
+        # before formatting so the common non-overreached path does no
+        # trigger f-string work
+        over_acwr = bool(acwr and acwr > 1.3)
+        over_strain = bool(strain and strain > 3500)
+        over_ri = bool(ri and ri < 0.6)
+        over_monotony = bool(monotony and monotony > 2.5)
+
+        if over_acwr + over_strain + over_ri + over_monotony >= 2 or over_ri:
+            triggers = []
+            if over_acwr:
+                triggers.append(f"ACWR {acwr} > 1.3")
+            if over_strain:
+                triggers.append(f"Strain {strain} > 3500")
+            if over_ri:
+                triggers.append(f"RI {ri} < 0.6")
+            if over_monotony:
+                triggers.append(f"Monotony {monotony} > 2.5")
             return "Overreached", triggers
         
         # Recovery phase
@@ -1541,22 +2012,7 @@ class IntervalsSync:
         Determine seasonal context based on current month.
         Assumes Northern Hemisphere cycling calendar.
         """
-        month = datetime.now().month
-        
-        if month in [11, 12]:
-            return "Off-season / Transition"
-        elif month in [1, 2]:
-            return "Early Base"
-        elif month in [3, 4]:
-            return "Late Base / Build"
-        elif month in [5, 6]:
-            return "Build / Early Race Season"
-        elif month in [7, 8]:
-            return "Peak Race Season"
-        elif month in [9, 10]:
-            return "Late Season / Transition"
-        else:
-            return "Unknown"
+        return self._SEASON_BY_MONTH_PAIR[(self._now.month - 1) // 2]
     
     # === ALERTS SYSTEM (v3.3.0) ===
     
@@ -1572,48 +2028,64 @@ class IntervalsSync:
         detected) to avoid false positives from cross-training TSS floor inflation.
         """
         alerts = []
-        
-        acwr = derived_metrics.get("acwr")
-        monotony = derived_metrics.get("monotony")
-        effective_monotony = derived_metrics.get("effective_monotony")
-        primary_sport = derived_metrics.get("primary_sport")
-        primary_sport_monotony = derived_metrics.get("primary_sport_monotony")
-        is_multi_sport = derived_metrics.get("multi_sport_detected", False)
-        strain = derived_metrics.get("strain")
-        ri = derived_metrics.get("recovery_index")
-        latest_hrv = derived_metrics.get("latest_hrv")
-        latest_rhr = derived_metrics.get("latest_rhr")
-        hrv_baseline_7d = derived_metrics.get("hrv_baseline_7d")
-        rhr_baseline_7d = derived_metrics.get("rhr_baseline_7d")
-        
+        emit = _alert_emitter(alerts)
+
+        (acwr, monotony, effective_monotony, primary_sport,
+         primary_sport_monotony, is_multi_sport, strain, ri,
+         latest_hrv, latest_rhr,
+         hrv_baseline_7d, rhr_baseline_7d) = self._ALERT_METRICS(derived_metrics)
+
+        capability = derived_metrics.get("capability", {})
+        durability = capability.get("durability", {})
+        dur_mean_7d = durability.get("mean_decoupling_7d")
+        dur_mean_28d = durability.get("mean_decoupling_28d")
+        dur_trend = durability.get("trend")
+        dur_high_drift_7d = durability.get("high_drift_count_7d", 0)
+        tid_comparison = capability.get("tid_comparison", {})
+        tid_drift = tid_comparison.get("drift")
+
+        # --- Green-light fast path ---
+        # Most syncs produce zero alerts. One combined test of every
+        # outermost trigger condition lets the steady-state case return
+        # before running any of the per-section blocks below. Each clause
+        # mirrors its section's entry threshold exactly.
+        if not (
+            (acwr is not None and (acwr <= 0.8 or acwr >= 1.3))
+            or (effective_monotony is not None and effective_monotony >= 2.3)
+            or (strain is not None and strain > 3500)
+            or (ri is not None and ri < 0.7)
+            or (latest_hrv and hrv_baseline_7d and hrv_baseline_7d > 0
+                and ((latest_hrv - hrv_baseline_7d) / hrv_baseline_7d) * 100 <= -20)
+            or (latest_rhr and rhr_baseline_7d and rhr_baseline_7d > 0
+                and latest_rhr - rhr_baseline_7d >= 5)
+            or (dur_mean_28d is not None and dur_mean_28d > 5.0)
+            or (dur_trend == "declining" and dur_mean_7d is not None
+                and dur_mean_28d is not None
+                and (dur_mean_7d - dur_mean_28d) > 2.0)
+            or dur_high_drift_7d >= 3
+            or tid_drift in ("acute_depolarization", "shifting")
+        ):
+            return alerts
+
         # --- ACWR Alerts ---
         if acwr is not None:
             if acwr <= 0.75 or acwr >= 1.35:
-                alerts.append({
-                    "metric": "acwr",
-                    "value": acwr,
-                    "severity": "alarm",
-                    "threshold": "0.75 / 1.35",
-                    "context": f"ACWR {acwr} outside safe range. Injury/overreach risk elevated.",
-                    "persistence_days": None,
-                    "tier": 2
-                })
+                emit("acwr", acwr, "alarm", "0.75 / 1.35",
+                     f"ACWR {acwr} outside safe range. Injury/overreach risk elevated.",
+                     tier=2)
             elif acwr <= 0.8 or acwr >= 1.3:
-                alerts.append({
-                    "metric": "acwr",
-                    "value": acwr,
-                    "severity": "warning",
-                    "threshold": "0.8 / 1.3",
-                    "context": f"ACWR {acwr} at edge of optimal range. Monitor closely. Alarm at 0.75/1.35.",
-                    "persistence_days": None,
-                    "tier": 2
-                })
+                emit("acwr", acwr, "warning", "0.8 / 1.3",
+                     f"ACWR {acwr} at edge of optimal range. Monitor closely. Alarm at 0.75/1.35.",
+                     tier=2)
         
         # --- Monotony Alerts (with deload context + multi-sport awareness) ---
         # Use effective_monotony for alert thresholds. When multi-sport training
         # is detected and primary sport monotony is lower than total, the effective
         # value reflects the actual training load variation of the main modality.
-        if effective_monotony is not None:
+        if effective_monotony is not None and effective_monotony >= 2.3:
+            # Context pieces are only needed once a threshold fires — the
+            # common below-threshold path skips the deload scan and the
+            # multi-sport note formatting entirely
             deload_context = self._detect_deload_context(tss_7d_total, tss_28d_total)
 
             # Build context string for multi-sport cases
@@ -1623,81 +2095,39 @@ class IntervalsSync:
 
             if effective_monotony >= 2.5:
                 if deload_context:
-                    alerts.append({
-                        "metric": "monotony",
-                        "value": effective_monotony,
-                        "severity": "info",
-                        "threshold": 2.5,
-                        "context": f"Monotony {effective_monotony} ≥ 2.5 but {deload_context}. Structural artifact, not overuse risk. Will normalize as 7-day window rolls forward.{multi_sport_note}",
-                        "persistence_days": None,
-                        "tier": 2
-                    })
+                    emit("monotony", effective_monotony, "info", 2.5,
+                         f"Monotony {effective_monotony} ≥ 2.5 but {deload_context}. Structural artifact, not overuse risk. Will normalize as 7-day window rolls forward.{multi_sport_note}",
+                         tier=2)
                 else:
-                    alerts.append({
-                        "metric": "monotony",
-                        "value": effective_monotony,
-                        "severity": "alarm",
-                        "threshold": 2.5,
-                        "context": f"Monotony {effective_monotony} ≥ 2.5. Overuse risk elevated. Vary training load.{multi_sport_note}",
-                        "persistence_days": None,
-                        "tier": 2
-                    })
+                    emit("monotony", effective_monotony, "alarm", 2.5,
+                         f"Monotony {effective_monotony} ≥ 2.5. Overuse risk elevated. Vary training load.{multi_sport_note}",
+                         tier=2)
             elif effective_monotony >= 2.3:
                 if deload_context:
-                    alerts.append({
-                        "metric": "monotony",
-                        "value": effective_monotony,
-                        "severity": "info",
-                        "threshold": 2.3,
-                        "context": f"Monotony {effective_monotony} approaching threshold but {deload_context}. Expected, not actionable.{multi_sport_note}",
-                        "persistence_days": None,
-                        "tier": 2
-                    })
+                    emit("monotony", effective_monotony, "info", 2.3,
+                         f"Monotony {effective_monotony} approaching threshold but {deload_context}. Expected, not actionable.{multi_sport_note}",
+                         tier=2)
                 else:
-                    alerts.append({
-                        "metric": "monotony",
-                        "value": effective_monotony,
-                        "severity": "warning",
-                        "threshold": 2.3,
-                        "context": f"Monotony {effective_monotony} approaching overuse threshold. Alarm at 2.5.{multi_sport_note}",
-                        "persistence_days": None,
-                        "tier": 2
-                    })
+                    emit("monotony", effective_monotony, "warning", 2.3,
+                         f"Monotony {effective_monotony} approaching overuse threshold. Alarm at 2.5.{multi_sport_note}",
+                         tier=2)
         
         # --- Strain Alerts ---
         if strain is not None and strain > 3500:
-            alerts.append({
-                "metric": "strain",
-                "value": strain,
-                "severity": "alarm",
-                "threshold": 3500,
-                "context": f"Strain {strain} > 3500. High cumulative stress. Consider load reduction.",
-                "persistence_days": None,
-                "tier": 2
-            })
+            emit("strain", strain, "alarm", 3500,
+                 f"Strain {strain} > 3500. High cumulative stress. Consider load reduction.",
+                 tier=2)
         
         # --- Recovery Index Alerts ---
         if ri is not None:
             if ri < 0.6:
-                alerts.append({
-                    "metric": "recovery_index",
-                    "value": ri,
-                    "severity": "alarm",
-                    "threshold": 0.6,
-                    "context": f"RI {ri} < 0.6. Immediate deload required.",
-                    "persistence_days": None,
-                    "tier": 1
-                })
+                emit("recovery_index", ri, "alarm", 0.6,
+                     f"RI {ri} < 0.6. Immediate deload required.",
+                     tier=1)
             elif ri < 0.7:
-                alerts.append({
-                    "metric": "recovery_index",
-                    "value": ri,
-                    "severity": "warning",
-                    "threshold": 0.7,
-                    "context": f"RI {ri} < 0.7. Monitor — if persists >3 days, deload review required.",
-                    "persistence_days": None,
-                    "tier": 1
-                })
+                emit("recovery_index", ri, "warning", 0.7,
+                     f"RI {ri} < 0.7. Monitor — if persists >3 days, deload review required.",
+                     tier=1)
         
         # --- HRV Alerts ---
         if latest_hrv and hrv_baseline_7d and hrv_baseline_7d > 0:
@@ -1705,27 +2135,19 @@ class IntervalsSync:
             if hrv_change_pct <= -20:
                 # Check persistence: count consecutive days with HRV ↓>20%
                 hrv_low_days = self._count_hrv_low_days(wellness_7d, hrv_baseline_7d)
-                
+
+                # Round once — both branches display the same values
+                hrv_r = round(latest_hrv, 1)
+                hrv_drop_r = round(abs(hrv_change_pct), 1)
+                hrv_threshold = f"↓>20% vs baseline ({round(hrv_baseline_7d, 1)})"
                 if hrv_low_days > 2:
-                    alerts.append({
-                        "metric": "hrv",
-                        "value": round(latest_hrv, 1),
-                        "severity": "alarm",
-                        "threshold": f"↓>20% vs baseline ({round(hrv_baseline_7d, 1)})",
-                        "context": f"HRV {round(latest_hrv, 1)} is {round(abs(hrv_change_pct), 1)}% below baseline, persisting {hrv_low_days} days.",
-                        "persistence_days": hrv_low_days,
-                        "tier": 1
-                    })
+                    emit("hrv", hrv_r, "alarm", hrv_threshold,
+                         f"HRV {hrv_r} is {hrv_drop_r}% below baseline, persisting {hrv_low_days} days.",
+                         tier=1, persistence_days=hrv_low_days)
                 else:
-                    alerts.append({
-                        "metric": "hrv",
-                        "value": round(latest_hrv, 1),
-                        "severity": "warning",
-                        "threshold": f"↓>20% vs baseline ({round(hrv_baseline_7d, 1)})",
-                        "context": f"HRV {round(latest_hrv, 1)} is {round(abs(hrv_change_pct), 1)}% below baseline. Monitor — alarm if persists >2 days.",
-                        "persistence_days": hrv_low_days,
-                        "tier": 1
-                    })
+                    emit("hrv", hrv_r, "warning", hrv_threshold,
+                         f"HRV {hrv_r} is {hrv_drop_r}% below baseline. Monitor — alarm if persists >2 days.",
+                         tier=1, persistence_days=hrv_low_days)
         
         # --- RHR Alerts ---
         if latest_rhr and rhr_baseline_7d and rhr_baseline_7d > 0:
@@ -1733,108 +2155,59 @@ class IntervalsSync:
             if rhr_change >= 5:
                 # Check persistence
                 rhr_high_days = self._count_rhr_high_days(wellness_7d, rhr_baseline_7d)
-                
+
+                rhr_r = round(latest_rhr, 1)
+                rhr_change_r = round(rhr_change, 1)
+                rhr_threshold = f"↑≥5bpm vs baseline ({round(rhr_baseline_7d, 1)})"
                 if rhr_high_days > 2:
-                    alerts.append({
-                        "metric": "rhr",
-                        "value": round(latest_rhr, 1),
-                        "severity": "alarm",
-                        "threshold": f"↑≥5bpm vs baseline ({round(rhr_baseline_7d, 1)})",
-                        "context": f"RHR {round(latest_rhr, 1)} is {round(rhr_change, 1)}bpm above baseline, persisting {rhr_high_days} days.",
-                        "persistence_days": rhr_high_days,
-                        "tier": 1
-                    })
+                    emit("rhr", rhr_r, "alarm", rhr_threshold,
+                         f"RHR {rhr_r} is {rhr_change_r}bpm above baseline, persisting {rhr_high_days} days.",
+                         tier=1, persistence_days=rhr_high_days)
                 else:
-                    alerts.append({
-                        "metric": "rhr",
-                        "value": round(latest_rhr, 1),
-                        "severity": "warning",
-                        "threshold": f"↑≥5bpm vs baseline ({round(rhr_baseline_7d, 1)})",
-                        "context": f"RHR {round(latest_rhr, 1)} is {round(rhr_change, 1)}bpm above baseline. Monitor — alarm if persists >2 days.",
-                        "persistence_days": rhr_high_days,
-                        "tier": 1
-                    })
+                    emit("rhr", rhr_r, "warning", rhr_threshold,
+                         f"RHR {rhr_r} is {rhr_change_r}bpm above baseline. Monitor — alarm if persists >2 days.",
+                         tier=1, persistence_days=rhr_high_days)
         
         # --- Durability Alerts (v3.4.0) ---
         # Aggregate decoupling trend from capability metrics
-        capability = derived_metrics.get("capability", {})
-        durability = capability.get("durability", {})
-        dur_mean_7d = durability.get("mean_decoupling_7d")
-        dur_mean_28d = durability.get("mean_decoupling_28d")
-        dur_trend = durability.get("trend")
-        dur_high_drift_7d = durability.get("high_drift_count_7d", 0)
-
         # Alarm: sustained high decoupling (28d mean > 5%)
         if dur_mean_28d is not None and dur_mean_28d > 5.0:
-            alerts.append({
-                "metric": "durability",
-                "value": dur_mean_28d,
-                "severity": "alarm",
-                "threshold": "28d mean > 5%",
-                "context": f"Sustained high decoupling ({dur_mean_28d}% 28d mean). Aerobic efficiency concern — review volume and recovery.",
-                "persistence_days": None,
-                "tier": 3
-            })
+            emit("durability", dur_mean_28d, "alarm", "28d mean > 5%",
+                 f"Sustained high decoupling ({dur_mean_28d}% 28d mean). Aerobic efficiency concern — review volume and recovery.",
+                 tier=3)
         # Warning: declining trend with >2% delta
         elif (dur_trend == "declining" and dur_mean_7d is not None
               and dur_mean_28d is not None
               and (dur_mean_7d - dur_mean_28d) > 2.0):
-            alerts.append({
-                "metric": "durability",
-                "value": dur_mean_7d,
-                "severity": "warning",
-                "threshold": "7d > 28d by > 2%",
-                "context": f"Durability declining: 7d mean decoupling {dur_mean_7d}% vs 28d {dur_mean_28d}%. Check fatigue and recovery.",
-                "persistence_days": None,
-                "tier": 3
-            })
+            emit("durability", dur_mean_7d, "warning", "7d > 28d by > 2%",
+                 f"Durability declining: 7d mean decoupling {dur_mean_7d}% vs 28d {dur_mean_28d}%. Check fatigue and recovery.",
+                 tier=3)
 
         # Warning: repeated poor durability (>= 3 high-drift sessions in 7d)
         if dur_high_drift_7d >= 3:
-            alerts.append({
-                "metric": "durability",
-                "value": dur_high_drift_7d,
-                "severity": "warning",
-                "threshold": ">= 3 sessions with >5% decoupling in 7d",
-                "context": f"Repeated poor durability: {dur_high_drift_7d} sessions with >5% decoupling in last 7 days.",
-                "persistence_days": None,
-                "tier": 3
-            })
+            emit("durability", dur_high_drift_7d, "warning", ">= 3 sessions with >5% decoupling in 7d",
+                 f"Repeated poor durability: {dur_high_drift_7d} sessions with >5% decoupling in last 7 days.",
+                 tier=3)
 
         # --- TID Drift Alerts (v3.4.0) ---
-        tid_comparison = capability.get("tid_comparison", {})
-        tid_drift = tid_comparison.get("drift")
-
         if tid_drift == "acute_depolarization":
             pi_7d = tid_comparison.get("pi_7d")
             pi_28d = tid_comparison.get("pi_28d")
-            alerts.append({
-                "metric": "tid_distribution",
-                "value": pi_7d,
-                "severity": "warning",
-                "threshold": "7d PI < 2.0, 28d PI >= 2.0",
-                "context": f"Acute depolarization: 7d PI {pi_7d} vs 28d PI {pi_28d}. Grey zone or threshold work displacing polarized structure.",
-                "persistence_days": None,
-                "tier": 3
-            })
+            emit("tid_distribution", pi_7d, "warning", "7d PI < 2.0, 28d PI >= 2.0",
+                 f"Acute depolarization: 7d PI {pi_7d} vs 28d PI {pi_28d}. Grey zone or threshold work displacing polarized structure.",
+                 tier=3)
         elif tid_drift == "shifting":
             cls_7d = tid_comparison.get("classification_7d")
             cls_28d = tid_comparison.get("classification_28d")
-            alerts.append({
-                "metric": "tid_distribution",
-                "value": cls_7d,
-                "severity": "warning",
-                "threshold": "7d/28d classification mismatch",
-                "context": f"TID shift: 7d {cls_7d} vs 28d {cls_28d}. Training distribution changing.",
-                "persistence_days": None,
-                "tier": 3
-            })
+            emit("tid_distribution", cls_7d, "warning", "7d/28d classification mismatch",
+                 f"TID shift: 7d {cls_7d} vs 28d {cls_28d}. Training distribution changing.",
+                 tier=3)
         
-        # Sort by tier (lower = more important), then severity
-        severity_order = {"alarm": 0, "warning": 1, "info": 2}
-        alerts.sort(key=lambda a: (a["tier"], severity_order.get(a["severity"], 3)))
-        
-        return alerts
+        # Sort by tier (lower = more important), then severity — the key
+        # tuple was already computed at emission time
+        alerts.sort(key=operator.itemgetter("_sort_key"))
+
+        return _strip_sort_keys(alerts)
     
     def _detect_deload_context(self, tss_7d_total: float, tss_28d_total: float) -> Optional[str]:
         """
@@ -1870,9 +2243,10 @@ class IntervalsSync:
         """Count consecutive days (from most recent) where HRV is ↓>20% below baseline"""
         threshold = baseline * 0.8
         count = 0
-        for w in reversed(wellness_7d):
-            hrv = w.get("hrv")
-            if self._is_valid_hrv(hrv) and hrv < threshold:
+        for i in range(len(wellness_7d) - 1, -1, -1):
+            hrv = wellness_7d[i].get("hrv")
+            # Inline of _is_valid_hrv — avoids a method call per day
+            if hrv is not None and 10 <= hrv <= 250 and hrv < threshold:
                 count += 1
             else:
                 break
@@ -1882,8 +2256,8 @@ class IntervalsSync:
         """Count consecutive days (from most recent) where RHR is ↑≥5bpm above baseline"""
         threshold = baseline + 5
         count = 0
-        for w in reversed(wellness_7d):
-            rhr = w.get("restingHR")
+        for i in range(len(wellness_7d) - 1, -1, -1):
+            rhr = wellness_7d[i].get("restingHR")
             if rhr is not None and rhr >= threshold:
                 count += 1
             else:
@@ -1892,45 +2266,71 @@ class IntervalsSync:
     
     # === HISTORY GENERATION (v3.3.0) ===
     
-    def _get_history_confidence(self) -> Dict:
+    def _load_history_meta(self) -> Dict:
         """
-        Check history.json availability and return confidence metadata.
+        Parse history.json once per run and memoize the metadata both
+        the refresh gate and the confidence block need. Returns a dict
+        with generated_at, age_days and total_months, or an empty dict
+        when the file is missing or unreadable.
         """
+        if self._history_meta is not None:
+            return self._history_meta
+
+        meta = {}
         history_path = self.script_dir / self.HISTORY_FILE
-        
         if history_path.exists():
             try:
-                with open(history_path, 'r') as f:
-                    history_data = json.load(f)
+                history_data = _load_json(history_path)
                 generated_at = history_data.get("generated_at", "")
-                
+
                 # Calculate age
                 try:
-                    gen_date = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
-                    age_days = (datetime.now() - gen_date.replace(tzinfo=None)).days
-                except:
+                    if _FROMISO_HANDLES_Z:
+                        gen_date = datetime.fromisoformat(generated_at)
+                    else:
+                        gen_date = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
+                    age_days = (self._now - gen_date.replace(tzinfo=None)).days
+                except ValueError:
                     age_days = None
-                
-                # Determine confidence from data range
-                total_months = history_data.get("data_range", {}).get("total_months", 0)
-                if total_months >= 12:
-                    confidence = "high"
-                elif total_months >= 3:
-                    confidence = "medium"
-                else:
-                    confidence = "low"
-                
-                return {
-                    "available": True,
-                    "last_generated": generated_at[:10] if generated_at else None,
+
+                meta = {
+                    "generated_at": generated_at,
                     "age_days": age_days,
-                    "total_months": total_months,
-                    "history_confidence": confidence
+                    "total_months": history_data.get("data_range", {}).get("total_months", 0)
                 }
             except Exception as e:
                 if self.debug:
                     print(f"  Could not read history.json: {e}")
-        
+
+        self._history_meta = meta
+        return meta
+
+    def _get_history_confidence(self) -> Dict:
+        """
+        Check history.json availability and return confidence metadata.
+        """
+        meta = self._load_history_meta()
+
+        if meta:
+            generated_at = meta["generated_at"]
+
+            # Determine confidence from data range
+            total_months = meta["total_months"]
+            if total_months >= 12:
+                confidence = "high"
+            elif total_months >= 3:
+                confidence = "medium"
+            else:
+                confidence = "low"
+
+            return {
+                "available": True,
+                "last_generated": generated_at[:10] if generated_at else None,
+                "age_days": meta["age_days"],
+                "total_months": total_months,
+                "history_confidence": confidence
+            }
+
         return {
             "available": False,
             "history_confidence": "low",
@@ -1957,7 +2357,7 @@ class IntervalsSync:
             return True
         
         # For REFRESH of existing history, apply the time gate
-        now = datetime.now()
+        now = self._now
         
         # Only on Sundays (6) or Mondays (0)
         if now.weekday() not in [0, 6]:
@@ -1967,27 +2367,56 @@ class IntervalsSync:
         if now.hour > 0 or (now.hour == 0 and now.minute > 30):
             return False
         
-        # Check age of existing file
-        try:
-            with open(history_path, 'r') as f:
-                history_data = json.load(f)
-            generated_at = history_data.get("generated_at", "")
-            gen_date = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
-            age_days = (datetime.now() - gen_date.replace(tzinfo=None)).days
-            
-            if age_days > 28:
-                if self.debug:
-                    print(f"  history.json is {age_days} days old — will regenerate")
-                return True
-            else:
-                if self.debug:
-                    print(f"  history.json is {age_days} days old — fresh enough")
-                return False
-        except Exception as e:
+        # Check age of existing file (shared memoized read)
+        age_days = self._load_history_meta().get("age_days")
+        if age_days is None:
             if self.debug:
-                print(f"  Could not parse history.json age: {e} — will regenerate")
+                print("  Could not parse history.json age — will regenerate")
             return True
+
+        if age_days > 28:
+            if self.debug:
+                print(f"  history.json is {age_days} days old — will regenerate")
+            return True
+        else:
+            if self.debug:
+                print(f"  history.json is {age_days} days old — fresh enough")
+            return False
     
+    def _load_day_stats_cache(self) -> Dict:
+        """
+        Load the per-day aggregate sidecar cache written by the previous
+        history generation (empty dict if absent/corrupt/unexpected shape).
+        """
+        cache_path = self.script_dir / self.DAY_STATS_CACHE_FILE
+        if cache_path.exists():
+            try:
+                cache = _load_json(cache_path)
+                if isinstance(cache, dict) and isinstance(cache.get("daily_stats"), dict):
+                    return cache
+            except Exception as e:
+                if self.debug:
+                    print(f"  Could not load day-stats cache: {e}")
+        return {}
+
+    def _save_day_stats_cache(self, daily_stats: Dict[str, Dict]):
+        """Persist the per-day aggregates next to the ETag sidecar cache."""
+        cache_path = self.script_dir / self.DAY_STATS_CACHE_FILE
+        try:
+            payload = {
+                "saved_at": self._now.isoformat(),
+                # The "types" set isn't JSON-serializable; a sorted list
+                # round-trips and joins the same way downstream
+                "daily_stats": {
+                    d: {**st, "types": sorted(st["types"])}
+                    for d, st in daily_stats.items()
+                },
+            }
+            _write_json(cache_path, payload)
+        except Exception as e:
+            if self.debug:
+                print(f"  Could not save day-stats cache: {e}")
+
     def generate_history(self) -> Dict:
         """
         Generate history.json with tiered granularity.
@@ -2001,21 +2430,57 @@ class IntervalsSync:
         """
         print("\n📊 Generating history.json...")
         
-        now = datetime.now()
-        
+        now = self._now
+
         # Determine how far back we can go (up to 3 years)
         earliest_3y = (now - timedelta(days=365 * 3)).strftime("%Y-%m-%d")
         newest = now.strftime("%Y-%m-%d")
         
-        # Fetch all activities for full range
-        print("  Fetching full activity history (up to 3 years)...")
+        # Warm-run delta: per-day aggregates from the previous generation
+        # are cached on disk, so only the window that can still have
+        # changed — new rides plus an edit margin behind the cache's save
+        # date — needs refetching. The API is range-based (oldest/newest),
+        # so the delta is expressed as a trailing refetch window.
+        fetch_oldest = earliest_3y
+        cached_day_stats = {}
+        day_cache = self._load_day_stats_cache()
+        if day_cache:
+            saved_day = day_cache.get("saved_at", "")[:10]
+            try:
+                saved_dt = datetime.strptime(saved_day, "%Y-%m-%d")
+                refetch_from = _iso_day(saved_dt - timedelta(days=self.DAY_STATS_REFETCH_DAYS))
+            except ValueError:
+                refetch_from = earliest_3y
+            if refetch_from > earliest_3y:
+                fetch_oldest = refetch_from
+                # Keep cached days outside the refetch window; days that
+                # rolled out of the 3-year range are dropped here too
+                cached_day_stats = {
+                    d: st for d, st in day_cache["daily_stats"].items()
+                    if earliest_3y <= d < refetch_from
+                }
+
+        # Fetch activities for the (possibly shortened) range
+        if cached_day_stats:
+            print(f"  Fetching activity history since {fetch_oldest} "
+                  f"({len(cached_day_stats)} cached days reused)...")
+        else:
+            print("  Fetching full activity history (up to 3 years)...")
+        fetch_ok = True
         try:
             all_activities = self._intervals_get("activities", {
-                "oldest": earliest_3y, "newest": newest
+                "oldest": fetch_oldest, "newest": newest
             })
+            # Project down to the fields the tier builders read — the
+            # 3-year response is the largest payload in the pipeline and
+            # most of each activity dict is never touched here
+            keep_fields = ("start_date_local", "type", "moving_time",
+                           "icu_training_load", "icu_zone_times", "feel")
+            all_activities = [{k: a.get(k) for k in keep_fields} for a in all_activities]
         except Exception as e:
             print(f"  ⚠️ Could not fetch full history: {e}")
             all_activities = []
+            fetch_ok = False
         
         # Fetch all wellness for full range
         print("  Fetching full wellness history...")
@@ -2030,17 +2495,32 @@ class IntervalsSync:
         # Fetch athlete data for FTP history from API
         print("  Fetching athlete settings...")
         athlete = self._intervals_get("")
-        
-        # Determine actual data range
-        activity_dates = sorted([a.get("start_date_local", "")[:10] for a in all_activities if a.get("start_date_local")])
-        
-        if activity_dates:
-            earliest_date = activity_dates[0]
-            latest_date = activity_dates[-1]
+
+        # Fetch phase done — one pruned write instead of one per store
+        self._save_etag_cache()
+
+        # Per-date activity aggregates: grouped and reduced in one pass,
+        # shared by the tier builders below. The key set doubles as the
+        # distinct active dates, so the data range and gap scan read from
+        # it instead of building and sorting a per-activity date list.
+        daily_stats = self._aggregate_daily_activity_stats(all_activities)
+        if cached_day_stats:
+            # Fresh aggregates win inside the refetch window; the merged
+            # dict covers the full 3-year range again
+            cached_day_stats.update(daily_stats)
+            daily_stats = cached_day_stats
+        # Don't let a failed fetch shrink the cache — keep the old one
+        if fetch_ok:
+            self._save_day_stats_cache(daily_stats)
+
+        # Determine actual data range (min/max beat a full sort here)
+        if daily_stats:
+            earliest_date = min(daily_stats)
+            latest_date = max(daily_stats)
         else:
             earliest_date = newest
             latest_date = newest
-        
+
         try:
             earliest_dt = datetime.strptime(earliest_date, "%Y-%m-%d")
             total_months = max(1, int((now - earliest_dt).days / 30.44))
@@ -2054,39 +2534,59 @@ class IntervalsSync:
             if date_str:
                 wellness_by_date[date_str] = w
         
-        # Build activity lookup by date
-        activities_by_date = defaultdict(list)
-        for a in all_activities:
-            date_str = a.get("start_date_local", "")[:10]
-            if date_str:
-                activities_by_date[date_str].append(a)
-        
         # === FTP TIMELINE (from wellness sportInfo history or settings) ===
         ftp_timeline = self._build_ftp_timeline(all_wellness, athlete)
         
         # === DATA GAPS ===
-        data_gaps = self._find_data_gaps(activity_dates, earliest_date, latest_date)
-        
-        # === 90-DAY DAILY ===
-        print("  Building 90-day daily tier...")
-        daily_90d = self._build_daily_tier(activities_by_date, wellness_by_date, days=90)
-        
-        # === 180-DAY WEEKLY ===
-        print("  Building 180-day weekly tier...")
-        weekly_180d = self._build_weekly_tier(activities_by_date, wellness_by_date, days=180)
-        
-        # === MONTHLY TIERS ===
-        monthly_tiers = {}
-        for years in [1, 2, 3]:
-            label = f"{years}y"
-            days_back = years * 365
-            if total_months >= years * 12 * 0.5:  # Only generate if enough data
-                print(f"  Building {label} monthly tier...")
-                monthly_tiers[f"monthly_{label}"] = self._build_monthly_tier(
-                    activities_by_date, wellness_by_date, days=days_back
-                )
-            else:
-                monthly_tiers[f"monthly_{label}"] = []
+        data_gaps = self._find_data_gaps(daily_stats.keys(), earliest_date, latest_date)
+
+        # Ordinal-keyed views shared by all three tier builders — their
+        # day loops only probe by date, so an integer key skips the
+        # per-day string formatting and hashing entirely
+        stats_by_ord = {}
+        for date_str, st in daily_stats.items():
+            try:
+                stats_by_ord[date.fromisoformat(date_str).toordinal()] = st
+            except ValueError:
+                continue
+        wellness_by_ord = {}
+        for date_str, w in wellness_by_date.items():
+            try:
+                wellness_by_ord[date.fromisoformat(date_str).toordinal()] = w
+            except ValueError:
+                continue
+
+        # === TIER BUILDERS ===
+        # The builders only read the shared ordinal views, so they are
+        # independent and can run concurrently like the fetch phase of
+        # the main sync. For the monthly tiers, a month row only depends
+        # on that month's data, so the shorter tiers are suffixes of the
+        # longest one: build the widest eligible span once and slice the
+        # rest by month string.
+        monthly_tiers = {f"monthly_{years}y": [] for years in (1, 2, 3)}
+        eligible = [years for years in (1, 2, 3)
+                    if total_months >= years * 12 * 0.5]  # Only generate if enough data
+        max_years = eligible[-1] if eligible else 0
+        print(f"  Building tiers (daily, weekly"
+              + (f", {max_years}y monthly)..." if eligible else ")..."))
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            f_daily = executor.submit(
+                self._build_daily_tier, stats_by_ord, wellness_by_ord, 90)
+            f_weekly = executor.submit(
+                self._build_weekly_tier, stats_by_ord, wellness_by_ord, 180)
+            f_monthly = executor.submit(
+                self._build_monthly_tier, stats_by_ord, wellness_by_ord,
+                max_years * 365) if eligible else None
+            daily_90d = f_daily.result()
+            weekly_180d = f_weekly.result()
+            full_monthly = f_monthly.result() if f_monthly else []
+        if eligible:
+            monthly_tiers[f"monthly_{max_years}y"] = full_monthly
+            for years in eligible[:-1]:
+                cutoff_month = (now - timedelta(days=years * 365)).strftime("%Y-%m")
+                monthly_tiers[f"monthly_{years}y"] = [
+                    r for r in full_monthly if r["month"] >= cutoff_month
+                ]
         
         # === SUMMARIES ===
         summaries = self._build_history_summaries(daily_90d, weekly_180d, monthly_tiers)
@@ -2108,69 +2608,112 @@ class IntervalsSync:
             **monthly_tiers
         }
         
-        # Save locally
+        # Save locally — history.json is the largest file we write, so
+        # _write_json's orjson path matters most here
         history_path = self.script_dir / self.HISTORY_FILE
-        with open(history_path, 'w') as f:
-            json.dump(history, f, indent=2, default=str)
+        _write_json(history_path, history, default=str)
         print(f"  ✅ history.json saved ({len(daily_90d)} daily, {len(weekly_180d)} weekly rows)")
+        # Drop the memoized metadata so later readers see the fresh file
+        self._history_meta = None
         
         return history
     
-    def _build_daily_tier(self, activities_by_date: Dict, wellness_by_date: Dict, 
+    # Empty-day placeholder for dates with no activities — shared so the
+    # tier builders can .get() against it without allocating per day
+    _EMPTY_DAY_STATS = {
+        "tss": 0, "seconds": 0, "count": 0, "types": (),
+        "z12": 0, "z3": 0, "z4": 0, "z5": 0, "z6": 0, "z7": 0,
+        "zone_total": 0, "longest": 0,
+        "feel_first": None, "feel_sum": 0, "feel_n": 0,
+        "is_hard": False,
+    }
+
+    def _aggregate_daily_activity_stats(self, all_activities: List[Dict]) -> Dict[str, Dict]:
+        """
+        Group and aggregate every fetched activity by date in a single
+        pass: load, duration, per-zone seconds, longest ride, feel, and
+        the hard-day flag per day. Each tier then reduces these per-day
+        rows instead of re-scanning the activity dicts and re-parsing
+        icu_zone_times itself. No intermediate date→activity-list
+        grouping is materialized.
+        """
+        stats = {}
+        bucket_of = _ZONE_BUCKET.get
+        for a in all_activities:
+            date_str = a.get("start_date_local", "")[:10]
+            if not date_str:
+                continue
+            st = stats.get(date_str)
+            if st is None:
+                st = stats[date_str] = {
+                    "tss": 0, "seconds": 0, "count": 0, "types": set(),
+                    "zsum": [0, 0, 0, 0, 0, 0],  # z1/z2 combined, then z3..z7
+                    "zone_total": 0, "longest": 0,
+                    "feel_first": None, "feel_sum": 0, "feel_n": 0,
+                }
+
+            st["tss"] += a.get("icu_training_load", 0) or 0
+            ride_seconds = a.get("moving_time", 0) or 0
+            st["seconds"] += ride_seconds
+            if ride_seconds > st["longest"]:
+                st["longest"] = ride_seconds
+            st["count"] += 1
+            st["types"].add(a.get("type", "Unknown"))
+
+            icu_zone_times = a.get("icu_zone_times")
+            if icu_zone_times:
+                zsum = st["zsum"]
+                zone_total = 0
+                for zone in icu_zone_times:
+                    secs = zone.get("secs", 0)
+                    k = bucket_of(zone.get("id", ""))
+                    if k is not None:
+                        zsum[k] += secs
+                    # Unrecognized zone ids still count toward the
+                    # distribution denominator (matches the old tiers)
+                    zone_total += secs
+                st["zone_total"] += zone_total
+
+            feel = a.get("feel")
+            if feel:
+                if st["feel_first"] is None:
+                    st["feel_first"] = feel
+                st["feel_sum"] += feel
+                st["feel_n"] += 1
+
+        # Finalize: expand the zone buckets and derive the hard-day flag
+        for st in stats.values():
+            z12, z3, z4, z5, z6, z7 = st.pop("zsum")
+            st["z12"] = z12
+            st["z3"] = z3
+            st["z4"] = z4
+            st["z5"] = z5
+            st["z6"] = z6
+            st["z7"] = z7
+            st["is_hard"] = self._is_hard_day(z3, z4, z5, z6, z7)
+        return stats
+
+    def _build_daily_tier(self, stats_by_ord: Dict, wellness_by_ord: Dict,
                           days: int) -> List[Dict]:
         """Build daily resolution rows for the 90-day tier."""
         rows = []
-        now = datetime.now()
-        
-        for i in range(days - 1, -1, -1):
-            date = (now - timedelta(days=i))
-            date_str = date.strftime("%Y-%m-%d")
-            
-            day_activities = activities_by_date.get(date_str, [])
-            wellness = wellness_by_date.get(date_str, {})
-            
-            total_tss = sum(a.get("icu_training_load", 0) or 0 for a in day_activities)
-            total_seconds = sum(a.get("moving_time", 0) or 0 for a in day_activities)
-            activity_types = list(set(a.get("type", "Unknown") for a in day_activities)) if day_activities else ["Rest"]
-            
-            # Zone ladder for hard day detection
-            # Cumulative thresholds: z3+ / z4+ / z5+ / z6+ / z7
-            # Per Seiler's polarized model + Foster's session RPE scaling
-            day_z3 = 0
-            day_z4 = 0
-            day_z5 = 0
-            day_z6 = 0
-            day_z7 = 0
-            for a in day_activities:
-                icu_zone_times = a.get("icu_zone_times", [])
-                if icu_zone_times:
-                    for zone in icu_zone_times:
-                        zid = zone.get("id", "").lower()
-                        secs = zone.get("secs", 0)
-                        if zid == "z3":
-                            day_z3 += secs
-                        elif zid == "z4":
-                            day_z4 += secs
-                        elif zid == "z5":
-                            day_z5 += secs
-                        elif zid == "z6":
-                            day_z6 += secs
-                        elif zid == "z7":
-                            day_z7 += secs
-            is_hard = (
-                (day_z3 + day_z4 + day_z5 + day_z6 + day_z7) >= 1800 or
-                (day_z4 + day_z5 + day_z6 + day_z7) >= 600 or
-                (day_z5 + day_z6 + day_z7) >= 300 or
-                (day_z6 + day_z7) >= 120 or
-                day_z7 >= 60
-            )
-            
+        now_ord = datetime.now().toordinal()
+        empty = self._EMPTY_DAY_STATS
+        # Hoisted bindings for the per-day loop
+        stats_get = stats_by_ord.get
+        wellness_get = wellness_by_ord.get
+
+        for day_ord in range(now_ord - days + 1, now_ord + 1):
+            st = stats_get(day_ord, empty)
+            wellness = wellness_get(day_ord, {})
+            date_str = _iso_day(date.fromordinal(day_ord))
+
             rows.append({
                 "date": date_str,
-                "total_hours": round(total_seconds / 3600, 2),
-                "total_tss": round(total_tss, 0),
-                "activity_count": len(day_activities),
-                "activity_types": ", ".join(activity_types),
+                "total_hours": round(st["seconds"] / 3600, 2),
+                "total_tss": round(st["tss"], 0),
+                "activity_count": st["count"],
+                "activity_types": ", ".join(st["types"]) if st["count"] else "Rest",
                 "ctl": wellness.get("ctl"),
                 "atl": wellness.get("atl"),
                 "tsb": round(wellness.get("ctl", 0) - wellness.get("atl", 0), 1) if wellness.get("ctl") and wellness.get("atl") else None,
@@ -2178,44 +2721,39 @@ class IntervalsSync:
                 "rhr": wellness.get("restingHR"),
                 "sleep_hours": round(wellness.get("sleepSecs", 0) / 3600, 2) if wellness.get("sleepSecs") else None,
                 "sleep_quality": wellness.get("sleepQuality"),
-                "feel": None,  # Not available in wellness, only in activities
+                "feel": st["feel_first"],
                 "weight_kg": wellness.get("weight"),
-                "is_hard_day": is_hard
+                "is_hard_day": st["is_hard"]
             })
-            
-            # Check feel from activities
-            for a in day_activities:
-                feel = a.get("feel")
-                if feel:
-                    rows[-1]["feel"] = feel
-                    break
-        
+
         return rows
     
-    def _build_weekly_tier(self, activities_by_date: Dict, wellness_by_date: Dict,
+    def _build_weekly_tier(self, stats_by_ord: Dict, wellness_by_ord: Dict,
                            days: int) -> List[Dict]:
         """Build weekly aggregate rows for the 180-day tier."""
         rows = []
         now = datetime.now()
-        
+        now_ord = now.toordinal()
+        empty = self._EMPTY_DAY_STATS
+        # Hoisted bindings for the per-day loop
+        stats_get = stats_by_ord.get
+        wellness_get = wellness_by_ord.get
+
         # Calculate weeks
         start_date = now - timedelta(days=days)
         # Align to Monday
         start_monday = start_date - timedelta(days=start_date.weekday())
-        
+
         current = start_monday
         while current < now:
-            week_end = current + timedelta(days=6)
-            if week_end > now:
-                week_end = now
-            
             week_tss = 0
             week_seconds = 0
             week_activities = 0
             week_hrv = []
             week_rhr = []
             week_sleep = []
-            week_feel = []
+            week_feel_sum = 0
+            week_feel_n = 0
             week_weight = []
             hard_days = 0
             longest_ride = 0
@@ -2227,89 +2765,52 @@ class IntervalsSync:
             atl_end = None
             tsb_end = None
             ramp_rate = None
-            
+
+            week_start_ord = current.toordinal()
             for d in range(7):
-                date = current + timedelta(days=d)
-                if date > now:
+                day_ord = week_start_ord + d
+                if day_ord > now_ord:
                     break
-                date_str = date.strftime("%Y-%m-%d")
-                
-                day_activities = activities_by_date.get(date_str, [])
-                wellness = wellness_by_date.get(date_str, {})
-                
-                day_tss = sum(a.get("icu_training_load", 0) or 0 for a in day_activities)
-                day_seconds = sum(a.get("moving_time", 0) or 0 for a in day_activities)
-                
-                week_tss += day_tss
-                week_seconds += day_seconds
-                week_activities += len(day_activities)
 
-                if self._is_valid_hrv(wellness.get("hrv")):
-                    week_hrv.append(wellness["hrv"])
+                st = stats_get(day_ord, empty)
+                wellness = wellness_get(day_ord, {})
+
+                week_tss += st["tss"]
+                week_seconds += st["seconds"]
+                week_activities += st["count"]
+
+                hrv = wellness.get("hrv")
+                # Inline of _is_valid_hrv — avoids a method call per day
+                if hrv is not None and 10 <= hrv <= 250:
+                    week_hrv.append(hrv)
                 if wellness.get("restingHR"):
                     week_rhr.append(wellness["restingHR"])
                 if wellness.get("sleepSecs"):
                     week_sleep.append(wellness["sleepSecs"] / 3600)
                 if wellness.get("weight"):
                     week_weight.append(wellness["weight"])
-                
+
                 ctl_end = wellness.get("ctl") or ctl_end
                 atl_end = wellness.get("atl") or atl_end
                 ramp_rate = wellness.get("rampRate") or ramp_rate
-                
-                # Zone and hard day analysis
-                day_z3 = 0
-                day_z4 = 0
-                day_z5 = 0
-                day_z6 = 0
-                day_z7 = 0
-                for a in day_activities:
-                    ride_seconds = a.get("moving_time", 0) or 0
-                    if ride_seconds > longest_ride:
-                        longest_ride = ride_seconds
-                    
-                    icu_zone_times = a.get("icu_zone_times", [])
-                    if icu_zone_times:
-                        for zone in icu_zone_times:
-                            zid = zone.get("id", "").lower()
-                            secs = zone.get("secs", 0)
-                            if zid in ["z1", "z2"]:
-                                z1_z2_time += secs
-                            elif zid == "z3":
-                                z3_time += secs
-                                day_z3 += secs
-                            elif zid == "z4":
-                                z4_plus_time += secs
-                                day_z4 += secs
-                            elif zid == "z5":
-                                z4_plus_time += secs
-                                day_z5 += secs
-                            elif zid == "z6":
-                                z4_plus_time += secs
-                                day_z6 += secs
-                            elif zid == "z7":
-                                z4_plus_time += secs
-                                day_z7 += secs
-                            total_zone_time += secs
-                    
-                    feel = a.get("feel")
-                    if feel:
-                        week_feel.append(feel)
-                
-                if (
-                    (day_z3 + day_z4 + day_z5 + day_z6 + day_z7) >= 1800 or
-                    (day_z4 + day_z5 + day_z6 + day_z7) >= 600 or
-                    (day_z5 + day_z6 + day_z7) >= 300 or
-                    (day_z6 + day_z7) >= 120 or
-                    day_z7 >= 60
-                ):
+
+                # Zone and hard-day reductions from the shared daily pass
+                if st["longest"] > longest_ride:
+                    longest_ride = st["longest"]
+                z1_z2_time += st["z12"]
+                z3_time += st["z3"]
+                z4_plus_time += st["z4"] + st["z5"] + st["z6"] + st["z7"]
+                total_zone_time += st["zone_total"]
+                week_feel_sum += st["feel_sum"]
+                week_feel_n += st["feel_n"]
+                if st["is_hard"]:
                     hard_days += 1
-            
+
             if ctl_end and atl_end:
                 tsb_end = round(ctl_end - atl_end, 1)
-            
+
             rows.append({
-                "week_start": current.strftime("%Y-%m-%d"),
+                "week_start": _iso_day(current),
                 "total_hours": round(week_seconds / 3600, 2),
                 "total_tss": round(week_tss, 0),
                 "activity_count": week_activities,
@@ -2317,41 +2818,47 @@ class IntervalsSync:
                 "atl_end": round(atl_end, 1) if atl_end else None,
                 "tsb_end": tsb_end,
                 "ramp_rate": round(ramp_rate, 2) if ramp_rate else None,
-                "avg_hrv": round(statistics.mean(week_hrv), 1) if week_hrv else None,
-                "avg_rhr": round(statistics.mean(week_rhr), 1) if week_rhr else None,
-                "avg_sleep_hours": round(statistics.mean(week_sleep), 2) if week_sleep else None,
+                "avg_hrv": round(sum(week_hrv) / len(week_hrv), 1) if week_hrv else None,
+                "avg_rhr": round(sum(week_rhr) / len(week_rhr), 1) if week_rhr else None,
+                "avg_sleep_hours": round(sum(week_sleep) / len(week_sleep), 2) if week_sleep else None,
                 "z1_z2_pct": round((z1_z2_time / total_zone_time) * 100, 1) if total_zone_time > 0 else None,
                 "z3_pct": round((z3_time / total_zone_time) * 100, 1) if total_zone_time > 0 else None,
                 "z4_plus_pct": round((z4_plus_time / total_zone_time) * 100, 1) if total_zone_time > 0 else None,
                 "hard_days": hard_days,
                 "longest_ride_hours": round(longest_ride / 3600, 2),
-                "avg_feel": round(statistics.mean(week_feel), 1) if week_feel else None,
+                "avg_feel": round(week_feel_sum / week_feel_n, 1) if week_feel_n else None,
                 "weight_kg": round(week_weight[-1], 1) if week_weight else None
             })
-            
+
             current += timedelta(days=7)
-        
+
         return rows
     
-    def _build_monthly_tier(self, activities_by_date: Dict, wellness_by_date: Dict,
+    def _build_monthly_tier(self, stats_by_ord: Dict, wellness_by_ord: Dict,
                             days: int) -> List[Dict]:
         """Build monthly aggregate rows for 1/2/3-year tiers."""
         rows = []
         now = datetime.now()
+        now_ord = now.toordinal()
         start_date = now - timedelta(days=days)
-        
-        # Group by month
-        current_month = datetime(start_date.year, start_date.month, 1)
-        
-        while current_month <= now:
-            month_str = current_month.strftime("%Y-%m")
-            
-            # Determine days in this month
-            if current_month.month == 12:
-                next_month = datetime(current_month.year + 1, 1, 1)
-            else:
-                next_month = datetime(current_month.year, current_month.month + 1, 1)
-            
+        empty = self._EMPTY_DAY_STATS
+        # Hoisted bindings for the per-day loop
+        stats_get = stats_by_ord.get
+        wellness_get = wellness_by_ord.get
+
+        # Group by month. Months are walked as integer ids
+        # (year * 12 + month - 1) so the outer loop is plain range
+        # arithmetic — no datetime stepping or December special case
+        start_ym = start_date.year * 12 + start_date.month - 1
+        end_ym = now.year * 12 + now.month - 1
+
+        for ym in range(start_ym, end_ym + 1):
+            year, month0 = divmod(ym, 12)
+            month_str = f"{year:04d}-{month0 + 1:02d}"
+            first_ord = date(year, month0 + 1, 1).toordinal()
+            next_year, next_month0 = divmod(ym + 1, 12)
+            next_first_ord = date(next_year, next_month0 + 1, 1).toordinal()
+
             month_tss = 0
             month_seconds = 0
             month_activities = 0
@@ -2367,79 +2874,44 @@ class IntervalsSync:
             total_zone_time = 0
             days_with_data = 0
             total_days_in_month = 0
-            
-            date = current_month
-            while date < next_month and date <= now:
-                date_str = date.strftime("%Y-%m-%d")
+
+            day_ord = first_ord
+            stop_ord = min(next_first_ord - 1, now_ord)
+            while day_ord <= stop_ord:
                 total_days_in_month += 1
-                
-                day_activities = activities_by_date.get(date_str, [])
-                wellness = wellness_by_date.get(date_str, {})
-                
-                if day_activities or wellness:
+
+                st = stats_get(day_ord, empty)
+                wellness = wellness_get(day_ord, {})
+
+                if st["count"] or wellness:
                     days_with_data += 1
-                
-                day_tss = sum(a.get("icu_training_load", 0) or 0 for a in day_activities)
-                day_seconds = sum(a.get("moving_time", 0) or 0 for a in day_activities)
-                
-                month_tss += day_tss
-                month_seconds += day_seconds
-                month_activities += len(day_activities)
 
+                month_tss += st["tss"]
+                month_seconds += st["seconds"]
+                month_activities += st["count"]
 
-                if self._is_valid_hrv(wellness.get("hrv")):
-                    month_hrv.append(wellness["hrv"])
+                hrv = wellness.get("hrv")
+                # Inline of _is_valid_hrv — avoids a method call per day
+                if hrv is not None and 10 <= hrv <= 250:
+                    month_hrv.append(hrv)
                 if wellness.get("restingHR"):
                     month_rhr.append(wellness["restingHR"])
                 if wellness.get("weight"):
                     month_weight.append(wellness["weight"])
                 if wellness.get("ctl"):
                     ctl_values.append(wellness["ctl"])
-                
-                day_z3 = 0
-                day_z4 = 0
-                day_z5 = 0
-                day_z6 = 0
-                day_z7 = 0
-                for a in day_activities:
-                    ride_seconds = a.get("moving_time", 0) or 0
-                    if ride_seconds > longest_ride:
-                        longest_ride = ride_seconds
-                    
-                    icu_zone_times = a.get("icu_zone_times", [])
-                    if icu_zone_times:
-                        for zone in icu_zone_times:
-                            zid = zone.get("id", "").lower()
-                            secs = zone.get("secs", 0)
-                            if zid in ["z1", "z2"]:
-                                z1_z2_time += secs
-                            elif zid == "z3":
-                                z3_time += secs
-                                day_z3 += secs
-                            elif zid == "z4":
-                                z4_plus_time += secs
-                                day_z4 += secs
-                            elif zid == "z5":
-                                z4_plus_time += secs
-                                day_z5 += secs
-                            elif zid == "z6":
-                                z4_plus_time += secs
-                                day_z6 += secs
-                            elif zid == "z7":
-                                z4_plus_time += secs
-                                day_z7 += secs
-                            total_zone_time += secs
-                
-                if (
-                    (day_z3 + day_z4 + day_z5 + day_z6 + day_z7) >= 1800 or
-                    (day_z4 + day_z5 + day_z6 + day_z7) >= 600 or
-                    (day_z5 + day_z6 + day_z7) >= 300 or
-                    (day_z6 + day_z7) >= 120 or
-                    day_z7 >= 60
-                ):
+
+                # Zone and hard-day reductions from the shared daily pass
+                if st["longest"] > longest_ride:
+                    longest_ride = st["longest"]
+                z1_z2_time += st["z12"]
+                z3_time += st["z3"]
+                z4_plus_time += st["z4"] + st["z5"] + st["z6"] + st["z7"]
+                total_zone_time += st["zone_total"]
+                if st["is_hard"]:
                     hard_days_total += 1
-                
-                date += timedelta(days=1)
+
+                day_ord += 1
             
             # Calculate weeks in this month for per-week averages
             weeks_in_period = max(1, total_days_in_month / 7)
@@ -2467,20 +2939,18 @@ class IntervalsSync:
                 "ctl_peak": round(max(ctl_values), 1) if ctl_values else None,
                 "ctl_low": round(min(ctl_values), 1) if ctl_values else None,
                 "ctl_end": round(ctl_values[-1], 1) if ctl_values else None,
-                "avg_hrv": round(statistics.mean(month_hrv), 1) if month_hrv else None,
-                "avg_rhr": round(statistics.mean(month_rhr), 1) if month_rhr else None,
+                "avg_hrv": round(sum(month_hrv) / len(month_hrv), 1) if month_hrv else None,
+                "avg_rhr": round(sum(month_rhr) / len(month_rhr), 1) if month_rhr else None,
                 "z1_z2_pct": round((z1_z2_time / total_zone_time) * 100, 1) if total_zone_time > 0 else None,
                 "z3_pct": round((z3_time / total_zone_time) * 100, 1) if total_zone_time > 0 else None,
                 "z4_plus_pct": round((z4_plus_time / total_zone_time) * 100, 1) if total_zone_time > 0 else None,
                 "hard_days_avg_per_week": round(hard_days_total / weeks_in_period, 1),
                 "longest_ride_hours": round(longest_ride / 3600, 2),
-                "avg_weight_kg": round(statistics.mean(month_weight), 1) if month_weight else None,
+                "avg_weight_kg": round(sum(month_weight) / len(month_weight), 1) if month_weight else None,
                 "dominant_phase": dominant_phase,
                 "days_with_data": days_with_data
             })
-            
-            current_month = next_month
-        
+
         return rows
     
     def _build_ftp_timeline(self, all_wellness: List[Dict], athlete: Dict) -> List[Dict]:
@@ -2516,12 +2986,14 @@ class IntervalsSync:
             outdoor_ftp = cycling_settings.get("ftp")
             indoor_ftp = cycling_settings.get("indoor_ftp")
             
-            # Check if current FTP is already the latest in timeline
-            outdoor_dates = {e["date"]: e["ftp"] for e in timeline if e["type"] == "outdoor"}
-            indoor_dates = {e["date"]: e["ftp"] for e in timeline if e["type"] == "indoor"}
-            
-            latest_outdoor = outdoor_dates.get(max(outdoor_dates.keys())) if outdoor_dates else None
-            latest_indoor = indoor_dates.get(max(indoor_dates.keys())) if indoor_dates else None
+            # Check if current FTP is already the latest on record — read
+            # straight from the history dicts (ISO dates compare
+            # lexicographically, so max() finds the newest entry) instead
+            # of rebuilding date→ftp maps from the timeline
+            outdoor_hist = ftp_history.get("outdoor", {})
+            indoor_hist = ftp_history.get("indoor", {})
+            latest_outdoor = outdoor_hist[max(outdoor_hist)] if outdoor_hist else None
+            latest_indoor = indoor_hist[max(indoor_hist)] if indoor_hist else None
             
             if outdoor_ftp and outdoor_ftp != latest_outdoor:
                 timeline.append({"date": today, "ftp": outdoor_ftp, "type": "outdoor", "source": "user_set"})
@@ -2533,7 +3005,7 @@ class IntervalsSync:
         
         return timeline
     
-    def _find_data_gaps(self, activity_dates: List[str], earliest: str, latest: str) -> List[Dict]:
+    def _find_data_gaps(self, activity_dates: Iterable[str], earliest: str, latest: str) -> List[Dict]:
         """
         Find periods with no activity data (gaps ≥ 3 days).
         Flags factually without inference about reasons.
@@ -2541,45 +3013,36 @@ class IntervalsSync:
         gaps = []
         if not activity_dates:
             return gaps
-        
-        date_set = set(activity_dates)
-        
+
         try:
-            start = datetime.strptime(earliest, "%Y-%m-%d")
-            end = datetime.strptime(latest, "%Y-%m-%d")
+            start_ord = datetime.strptime(earliest, "%Y-%m-%d").toordinal()
+            end_ord = datetime.strptime(latest, "%Y-%m-%d").toordinal()
         except:
             return gaps
-        
-        gap_start = None
-        current = start
-        
-        while current <= end:
-            date_str = current.strftime("%Y-%m-%d")
-            
-            if date_str not in date_set:
-                if gap_start is None:
-                    gap_start = current
-            else:
-                if gap_start is not None:
-                    gap_days = (current - gap_start).days
-                    if gap_days >= 3:
-                        gaps.append({
-                            "period": f"{gap_start.strftime('%Y-%m-%d')} to {(current - timedelta(days=1)).strftime('%Y-%m-%d')}",
-                            "days_missing": gap_days
-                        })
-                    gap_start = None
-            
-            current += timedelta(days=1)
-        
-        # Handle trailing gap
-        if gap_start is not None:
-            gap_days = (end - gap_start).days + 1
-            if gap_days >= 3:
+
+        # Active days as sorted ordinals — gaps fall out of adjacent
+        # differences instead of a day-by-day walk over the whole range
+        ords = []
+        for date_str in set(activity_dates):
+            try:
+                day_ord = date.fromisoformat(date_str).toordinal()
+            except ValueError:
+                continue
+            if start_ord <= day_ord <= end_ord:
+                ords.append(day_ord)
+        ords.sort()
+
+        # Sentinels one day outside the range make leading and trailing
+        # gaps plain adjacent pairs like any other
+        bounds = [start_ord - 1] + ords + [end_ord + 1]
+        for a, b in zip(bounds, bounds[1:]):
+            days_missing = b - a - 1
+            if days_missing >= 3:
                 gaps.append({
-                    "period": f"{gap_start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}",
-                    "days_missing": gap_days
+                    "period": f"{_iso_day(date.fromordinal(a + 1))} to {_iso_day(date.fromordinal(b - 1))}",
+                    "days_missing": days_missing
                 })
-        
+
         return gaps
     
     def _build_history_summaries(self, daily_90d: List[Dict], weekly_180d: List[Dict],
@@ -2610,8 +3073,8 @@ class IntervalsSync:
             ctl_values = [w["ctl_end"] for w in weekly_180d if w["ctl_end"]]
             
             summaries["180d"] = {
-                "avg_weekly_tss": round(statistics.mean(tss_values), 0) if tss_values else None,
-                "avg_weekly_hours": round(statistics.mean(hours_values), 1) if hours_values else None,
+                "avg_weekly_tss": round(sum(tss_values) / len(tss_values), 0) if tss_values else None,
+                "avg_weekly_hours": round(sum(hours_values) / len(hours_values), 1) if hours_values else None,
                 "ctl_start": round(ctl_values[0], 1) if ctl_values else None,
                 "ctl_end": round(ctl_values[-1], 1) if ctl_values else None,
                 "weeks_tracked": len(weekly_180d)
@@ -2626,7 +3089,7 @@ class IntervalsSync:
                 
                 label = key.replace("monthly_", "")
                 summaries[label] = {
-                    "avg_monthly_tss": round(statistics.mean(tss_values), 0) if tss_values else None,
+                    "avg_monthly_tss": round(sum(tss_values) / len(tss_values), 0) if tss_values else None,
                     "ctl_peak": round(max(ctl_values), 1) if ctl_values else None,
                     "ctl_low": round(min(ctl_values), 1) if ctl_values else None,
                     "months_tracked": len(monthly)
@@ -2655,15 +3118,13 @@ class IntervalsSync:
                 print("  Skipping update check — no GitHub credentials")
             return
         
-        headers = {
-            "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github+json"
-        }
-        
-        # Fetch changelog.json from upstream
+        # Session carries the GitHub Accept header; only auth is per call
+        headers = {"Authorization": f"token {self.github_token}"}
+
+        # Fetch changelog.json from upstream (public raw fetch, no auth)
         try:
             url = f"https://raw.githubusercontent.com/{self.UPSTREAM_REPO}/main/{self.CHANGELOG_FILE}"
-            response = requests.get(url, timeout=10)
+            response = self._gh_session.get(url, timeout=10)
             if response.status_code != 200:
                 if self.debug:
                     print(f"  No changelog.json found upstream (HTTP {response.status_code})")
@@ -2689,7 +3150,7 @@ class IntervalsSync:
             search_params = {
                 "q": f'repo:{self.github_repo} "{issue_title}" in:title'
             }
-            response = requests.get(search_url, headers=headers, params=search_params, timeout=10)
+            response = self._gh_session.get(search_url, headers=headers, params=search_params, timeout=10)
             
             if response.status_code == 200:
                 results = response.json()
@@ -2720,7 +3181,7 @@ class IntervalsSync:
                 "body": body,
                 "labels": ["update-notification"]
             }
-            response = requests.post(issues_url, headers=headers, json=payload, timeout=10)
+            response = self._gh_session.post(issues_url, headers=headers, json=payload, timeout=10)
             
             if response.status_code == 201:
                 print(f"  📢 Update notification created: {issue_title}")
@@ -2731,43 +3192,49 @@ class IntervalsSync:
             if self.debug:
                 print(f"  Could not create update issue: {e}")
     
+    @staticmethod
+    def _first(act: Dict, keys: Tuple[str, ...]):
+        """Return the first truthy value among the alias keys (None if none)."""
+        get = act.get
+        for k in keys:
+            v = get(k)
+            if v:
+                return v
+        return None
+
     def _format_activities(self, activities: List[Dict], anonymize: bool = False) -> List[Dict]:
         """Format activities for LLM analysis"""
         formatted = []
+        # Hoisted bindings and tables — the loop body touches them once
+        # per field per row, so local reads beat repeated self.* lookups
+        is_outdoor = self.OUTDOOR_TYPES.__contains__
+        first = self._first
+        hr_zone_labels = self._HR_ZONE_LABELS
+        power_label_of = self._POWER_ZONE_LABELS.get
         for i, act in enumerate(activities):
-            avg_power = (act.get("average_watts") or act.get("avg_watts") or 
-                        act.get("average_power") or act.get("avgWatts") or
-                        act.get("icu_average_watts"))
-            norm_power = (act.get("weighted_average_watts") or act.get("np") or 
-                         act.get("icu_pm_np") or act.get("normalizedPower") or
-                         act.get("icu_weighted_avg_watts"))
-            avg_hr = (act.get("average_heartrate") or act.get("avg_hr") or 
-                     act.get("average_heart_rate") or act.get("avgHr") or
-                     act.get("icu_average_hr"))
-            max_hr = (act.get("max_heartrate") or act.get("max_hr") or 
-                     act.get("max_heart_rate") or act.get("maxHr") or
-                     act.get("icu_max_hr"))
-            
-            avg_cadence = (act.get("average_cadence") or act.get("avg_cadence") or
-                          act.get("icu_average_cadence"))
-            avg_temp = (act.get("average_weather_temp") or act.get("average_temp") or 
-                       act.get("avg_temp") or act.get("average_temperature"))
+            avg_power = first(act, self._AVG_POWER_KEYS)
+            norm_power = first(act, self._NORM_POWER_KEYS)
+            avg_hr = first(act, self._AVG_HR_KEYS)
+            max_hr = first(act, self._MAX_HR_KEYS)
+
+            avg_cadence = first(act, self._AVG_CADENCE_KEYS)
+            avg_temp = first(act, self._AVG_TEMP_KEYS)
             joules = act.get("icu_joules")
             work_kj = round(joules / 1000, 1) if joules else None
-            calories = act.get("calories") or act.get("icu_calories")
+            calories = first(act, self._CALORIES_KEYS)
             variability_index = act.get("icu_variability_index")
-            decoupling = act.get("icu_hr_decoupling") or act.get("decoupling")
-            
+            decoupling = first(act, self._DECOUPLING_KEYS)
+
             avg_speed_ms = act.get("average_speed")
             max_speed_ms = act.get("max_speed")
             avg_speed = round(avg_speed_ms * 3.6, 1) if avg_speed_ms else None
             max_speed = round(max_speed_ms * 3.6, 1) if max_speed_ms else None
-            avg_pace = act.get("average_pace") or act.get("icu_pace")
-            
-            weather = act.get("weather_description") or act.get("weather")
-            humidity = act.get("humidity") or act.get("average_humidity")
-            wind_speed = act.get("average_wind_speed") or act.get("wind_speed")
-            
+            avg_pace = first(act, self._AVG_PACE_KEYS)
+
+            weather = first(act, self._WEATHER_KEYS)
+            humidity = first(act, self._HUMIDITY_KEYS)
+            wind_speed = first(act, self._WIND_KEYS)
+
             carbs_used = act.get("carbs_used")
             carbs_ingested = act.get("carbs_ingested")
             
@@ -2776,18 +3243,18 @@ class IntervalsSync:
             
             icu_hr_zone_times = act.get("icu_hr_zone_times", [])
             if icu_hr_zone_times and isinstance(icu_hr_zone_times, list):
-                zone_labels = ["z1_time", "z2_time", "z3_time", "z4_time", "z5_time", "z6_time", "z7_time"]
-                for idx, secs in enumerate(icu_hr_zone_times):
-                    if idx < len(zone_labels):
-                        hr_zones[zone_labels[idx]] = secs if secs is not None else 0
-            
+                # zip truncates at the shorter sequence, so extra entries
+                # beyond z7 are ignored like before
+                for label, secs in zip(hr_zone_labels, icu_hr_zone_times):
+                    hr_zones[label] = secs if secs is not None else 0
+
             icu_zone_times = act.get("icu_zone_times", [])
             if icu_zone_times:
                 for zone in icu_zone_times:
-                    zone_id = zone.get("id", "").lower()
-                    secs = zone.get("secs", 0)
-                    if zone_id in ["z1", "z2", "z3", "z4", "z5", "z6", "z7"]:
-                        power_zones[f"{zone_id}_time"] = secs if secs is not None else 0
+                    label = power_label_of(zone.get("id", ""))
+                    if label is not None:
+                        secs = zone.get("secs", 0)
+                        power_zones[label] = secs if secs is not None else 0
             
             zone_dist = {}
             if hr_zones:
@@ -2800,7 +3267,7 @@ class IntervalsSync:
             
             activity_name = act.get("name", "")
             if anonymize:
-                if act.get("type", "") in self.OUTDOOR_TYPES:
+                if is_outdoor(act.get("type", "")):
                     activity_name = "Training Session"
             
             activity = {
@@ -2842,27 +3309,21 @@ class IntervalsSync:
     
     def _format_wellness(self, wellness: List[Dict]) -> List[Dict]:
         """Format wellness data"""
-        formatted = []
-        for w in wellness:
-            entry = {
-                "date": w.get("id", "unknown"),
-                "weight_kg": w.get("weight"),
-                "resting_hr": w.get("restingHR"),
-                "hrv_rmssd": w.get("hrv"),
-                "hrv_sdnn": w.get("hrvSdnn"),
-                "sleep_hours": round(w["sleepSecs"] / 3600, 2) if w.get("sleepSecs") else None,
-                "sleep_quality": w.get("sleepQuality"),
-                "sleep_score": w.get("sleepScore"),
-                "mental_energy": w.get("mentalEnergy"),
-                "fatigue": w.get("fatigue"),
-                "soreness": w.get("soreness"),
-                "avg_sleeping_hr": w.get("avgSleepingHR"),
-                "vo2max": w.get("vo2max")
-            }
-            
-            formatted.append(entry)
-        
-        return formatted
+        return [{
+            "date": w.get("id", "unknown"),
+            "weight_kg": w.get("weight"),
+            "resting_hr": w.get("restingHR"),
+            "hrv_rmssd": w.get("hrv"),
+            "hrv_sdnn": w.get("hrvSdnn"),
+            "sleep_hours": round(w["sleepSecs"] / 3600, 2) if w.get("sleepSecs") else None,
+            "sleep_quality": w.get("sleepQuality"),
+            "sleep_score": w.get("sleepScore"),
+            "mental_energy": w.get("mentalEnergy"),
+            "fatigue": w.get("fatigue"),
+            "soreness": w.get("soreness"),
+            "avg_sleeping_hr": w.get("avgSleepingHR"),
+            "vo2max": w.get("vo2max")
+        } for w in wellness]
     
     def _format_events(self, events: List[Dict], anonymize: bool = False) -> List[Dict]:
         """Format planned workouts"""
@@ -2890,32 +3351,45 @@ class IntervalsSync:
         Scientific basis: Mujika & Padilla (2003), Bosquet et al. (2007), Altini (HRV)
         """
         
-        today_date = datetime.strptime(today, "%Y-%m-%d").date()
-        
-        # Filter to race events only
-        race_categories = {"RACE_A", "RACE_B", "RACE_C"}
+        # Nothing planned — skip the date parsing and scans entirely
+        if not future_events:
+            return {
+                "next_race": None,
+                "all_races": [],
+                "taper_alert": {"active": False},
+                "race_week": {"active": False}
+            }
+
+        # fromisoformat beats strptime here — no per-call format parse
+        today_date = date.fromisoformat(today)
+
+        # Filter to race events only. The cheap category check runs
+        # before any date work, so planned workouts cost one set probe.
+        race_categories = self._RACE_CATEGORIES
         race_events = []
         for evt in future_events:
             cat = evt.get("category", "")
-            if cat in race_categories:
-                start = evt.get("start_date_local", "")[:10]
-                if start:
-                    try:
-                        evt_date = datetime.strptime(start, "%Y-%m-%d").date()
-                        days_until = (evt_date - today_date).days
-                        if days_until >= 0:
-                            race_events.append({
-                                "name": evt.get("name", "Unnamed Race"),
-                                "date": start,
-                                "category": cat,
-                                "type": evt.get("type", "Unknown"),
-                                "days_until": days_until,
-                                "moving_time_seconds": evt.get("moving_time"),
-                                "distance_meters": evt.get("distance"),
-                                "_raw": evt  # Keep raw for race-week building
-                            })
-                    except ValueError:
-                        continue
+            if cat not in race_categories:
+                continue
+            start = evt.get("start_date_local", "")[:10]
+            if not start:
+                continue
+            try:
+                evt_date = date.fromisoformat(start)
+            except ValueError:
+                continue
+            days_until = (evt_date - today_date).days
+            if days_until >= 0:
+                race_events.append({
+                    "name": evt.get("name", "Unnamed Race"),
+                    "date": start,
+                    "category": cat,
+                    "type": evt.get("type", "Unknown"),
+                    "days_until": days_until,
+                    "moving_time_seconds": evt.get("moving_time"),
+                    "distance_meters": evt.get("distance"),
+                    "_raw": evt  # Keep raw for race-week building
+                })
         
         # Sort by date
         race_events.sort(key=lambda x: x["days_until"])
@@ -2941,7 +3415,7 @@ class IntervalsSync:
         
         # Race-week: RACE_A or RACE_B within 7 days
         # If both exist, prioritise RACE_A
-        race_week_candidates = [r for r in race_events if r["category"] in {"RACE_A", "RACE_B"} and r["days_until"] <= 7]
+        race_week_candidates = [r for r in race_events if r["category"] in self._RACE_AB and r["days_until"] <= 7]
         race_week_target = None
         if race_week_candidates:
             a_races = [r for r in race_week_candidates if r["category"] == "RACE_A"]
@@ -2978,7 +3452,7 @@ class IntervalsSync:
         Assumes zero training load for remaining days to project race-day TSB.
         """
         
-        evt_date = datetime.strptime(race_event["date"], "%Y-%m-%d").date()
+        evt_date = date.fromisoformat(race_event["date"])
         days_until = race_event["days_until"]
         category = race_event["category"]
         moving_time = race_event.get("moving_time_seconds")
@@ -3000,28 +3474,23 @@ class IntervalsSync:
         budget_max = round(normal_weekly_tss * budget_max_pct)
         
         # Race-week TSS spent: sum TSS from activities within race week window
-        race_week_start = evt_date - timedelta(days=7)
+        race_week_start = evt_date - _TD7
         tss_spent = 0
         for act in activities_7d:
             act_date_str = act.get("start_date_local", "")[:10]
             if act_date_str:
                 try:
-                    act_date = datetime.strptime(act_date_str, "%Y-%m-%d").date()
+                    act_date = date.fromisoformat(act_date_str)
                     if race_week_start <= act_date <= today_date:
                         tss_spent += act.get("icu_training_load", 0) or 0
                 except ValueError:
                     continue
         tss_spent = round(tss_spent)
         
-        # TSB projection for race day (assume zero load for remaining days)
-        ctl_decay = math.exp(-1/42)   # ~0.9765
-        atl_decay = math.exp(-1/7)    # ~0.8668
-        
-        proj_ctl = current_ctl if current_ctl else 0
-        proj_atl = current_atl if current_atl else 0
-        for _ in range(days_until):
-            proj_ctl *= ctl_decay
-            proj_atl *= atl_decay
+        # TSB projection for race day (assume zero load for remaining
+        # days). n days of decay collapse to one exp: decay^n = e^(-n/tc)
+        proj_ctl = (current_ctl or 0) * math.exp(-days_until / 42)
+        proj_atl = (current_atl or 0) * math.exp(-days_until / 7)
         projected_tsb = round(proj_ctl - proj_atl, 1)
         
         # Event duration classification
@@ -3059,10 +3528,10 @@ class IntervalsSync:
             carb_applicable = True  # Default assumption for A races
         
         carb_active = carb_applicable and days_until <= 4
-        carb_start_date = (evt_date - timedelta(days=4)).strftime("%Y-%m-%d")
+        carb_start_date = (evt_date - _TD4).strftime("%Y-%m-%d")
         
         # Opener day (D-2)
-        opener_date = (evt_date - timedelta(days=2)).strftime("%Y-%m-%d")
+        opener_date = (evt_date - _TD2).strftime("%Y-%m-%d")
         opener_intensity = "lighter" if duration_class == "long_endurance" else (
             "more_intense" if duration_class == "short_intense" else "standard"
         )
@@ -3117,23 +3586,27 @@ class IntervalsSync:
             }
         }
     
+    # Race-week day protocol definitions, keyed by days until the event:
+    # (label, min_pct, max_pct, zones, purpose) with load percentages of
+    # CTL. Static, so built once at class definition rather than per call.
+    _DAY_PROTOCOLS = {
+        7: ("Last key session", 0.75, 1.00, "3-5 efforts Z4-Z5 (1-3 min)", "Fitness confirmation. Verify strong power/HR response."),
+        6: ("Recovery", 0.00, 0.30, "Z1-Z2 only", "Active recovery."),
+        5: ("Moderate endurance", 0.40, 0.60, "Z1-Z2 + 2-3 race-pace touches", "Maintain feel without adding fatigue."),
+        4: ("Easy / rest", 0.00, 0.40, "Z1-Z2 only", "Volume reduction. Carb loading begins if applicable."),
+        3: ("Easy / rest", 0.00, 0.40, "Z1-Z2 only", "Taper tantrums expected (D-4 to D-2). Normal — not lost fitness."),
+        2: ("Opener", 0.30, 0.50, "3-5 efforts Z4-Z6 (20-60s), high cadence, full recovery", "Neuromuscular activation."),
+        1: ("Rest / minimal", 0.00, 0.20, "Z1 only if active", "Final rest, logistics, equipment check."),
+        0: ("Race day", 0.00, 0.00, "Race effort", "Go/no-go assessment. Execute race plan.")
+    }
+
     def _get_day_protocol(self, days_until: int, ctl: float, duration_class: str, category: str) -> Dict:
         """
         Return today's race-week protocol based on days until event.
         Load targets as TSS = percentage of CTL.
         """
-        # Day protocol definitions: (label, min_pct, max_pct, zones, purpose)
-        protocols = {
-            7: ("Last key session", 0.75, 1.00, "3-5 efforts Z4-Z5 (1-3 min)", "Fitness confirmation. Verify strong power/HR response."),
-            6: ("Recovery", 0.00, 0.30, "Z1-Z2 only", "Active recovery."),
-            5: ("Moderate endurance", 0.40, 0.60, "Z1-Z2 + 2-3 race-pace touches", "Maintain feel without adding fatigue."),
-            4: ("Easy / rest", 0.00, 0.40, "Z1-Z2 only", "Volume reduction. Carb loading begins if applicable."),
-            3: ("Easy / rest", 0.00, 0.40, "Z1-Z2 only", "Taper tantrums expected (D-4 to D-2). Normal — not lost fitness."),
-            2: ("Opener", 0.30, 0.50, "3-5 efforts Z4-Z6 (20-60s), high cadence, full recovery", "Neuromuscular activation."),
-            1: ("Rest / minimal", 0.00, 0.20, "Z1 only if active", "Final rest, logistics, equipment check."),
-            0: ("Race day", 0.00, 0.00, "Race effort", "Go/no-go assessment. Execute race plan.")
-        }
-        
+        protocols = self._DAY_PROTOCOLS
+
         # Default for days > 7 (shouldn't happen in race week, but defensive)
         if days_until > 7:
             return {
@@ -3172,19 +3645,14 @@ class IntervalsSync:
     def _generate_race_alerts(self, race_calendar: Dict) -> List[Dict]:
         """Generate race-specific alerts for the alerts array."""
         alerts = []
-        
+        emit = _alert_emitter(alerts)
+
         # Taper onset alert
         taper = race_calendar.get("taper_alert", {})
         if taper.get("active"):
-            alerts.append({
-                "metric": "race_taper",
-                "value": taper.get("days_until"),
-                "severity": "info",
-                "threshold": "RACE_A within 8-14 days",
-                "context": taper.get("message", "Taper onset detected."),
-                "persistence_days": None,
-                "tier": 1
-            })
+            emit("race_taper", taper.get("days_until"), "info", "RACE_A within 8-14 days",
+                 taper.get("message", "Taper onset detected."),
+                 tier=1)
         
         # Race-week alerts
         rw = race_calendar.get("race_week", {})
@@ -3192,55 +3660,65 @@ class IntervalsSync:
             # Daily status alert
             today_proto = rw.get("today", {})
             load = today_proto.get("load_target_tss", {})
-            alerts.append({
-                "metric": "race_week",
-                "value": rw.get("days_until_event"),
-                "severity": "info",
-                "threshold": f"{rw.get('event_category')} within 7 days",
-                "context": (
+            emit("race_week", rw.get("days_until_event"), "info", f"{rw.get('event_category')} within 7 days",
+                 (
                     f"Race week {rw.get('current_day')} of '{rw.get('event_name')}'. "
                     f"Today: {today_proto.get('label', '?')}, "
                     f"{load.get('min', 0)}-{load.get('max', 0)} TSS. "
                     f"{today_proto.get('zones', '')}"
                 ),
-                "persistence_days": None,
-                "tier": 1
-            })
+                 tier=1)
             
             # TSB projection warning
             projected = rw.get("projected_race_day_tsb")
             tsb_range = rw.get("tsb_target_range", {})
             if projected is not None and tsb_range:
                 if projected < tsb_range.get("min", 0):
-                    alerts.append({
-                        "metric": "race_week_tsb",
-                        "value": projected,
-                        "severity": "warning",
-                        "threshold": f"TSB target {tsb_range.get('min')}-{tsb_range.get('max')}",
-                        "context": (
+                    emit("race_week_tsb", projected, "warning", f"TSB target {tsb_range.get('min')}-{tsb_range.get('max')}",
+                         (
                             f"Projected race-day TSB {projected} is below target range "
                             f"{tsb_range.get('min')}-{tsb_range.get('max')}. "
                             f"Consider additional rest to reach target."
                         ),
-                        "persistence_days": None,
-                        "tier": 1
-                    })
-        
-        return alerts
+                         tier=1)
+
+        # Race alerts keep their emission order (taper → race week → TSB)
+        return _strip_sort_keys(alerts)
     
-    def _compute_weekly_summary(self, activities: List[Dict], wellness: List[Dict]) -> Dict:
-        """Compute weekly training summary from actual activity data"""
-        total_tss = sum(act.get("icu_training_load", 0) for act in activities if act.get("icu_training_load"))
-        total_seconds = sum(act.get("moving_time", 0) for act in activities)
+    def _compute_weekly_summary(self, activities: List[Dict], wellness: List[Dict],
+                                totals: Tuple[float, float] = None) -> Dict:
+        """
+        Compute weekly training summary from actual activity data.
+
+        Accepts optional pre-aggregated (total_seconds, total_tss) so callers
+        that already walked the activity list don't pay for a second pass.
+        """
+        if totals is not None:
+            total_seconds, total_tss = totals
+        else:
+            # One pass over the activities for both sums
+            total_tss = 0
+            total_seconds = 0
+            for act in activities:
+                total_tss += act["_tss"]
+                total_seconds += act["_moving"]
         total_hours = total_seconds / 3600
 
-        avg_hrv = None
-        avg_rhr = None
-        if wellness:
-            hrv_values = [w.get("hrv") for w in wellness if self._is_valid_hrv(w.get("hrv"))]
-            rhr_values = [w.get("restingHR") for w in wellness if w.get("restingHR")]
-            avg_hrv = round(sum(hrv_values) / len(hrv_values), 1) if hrv_values else None
-            avg_rhr = round(sum(rhr_values) / len(rhr_values), 1) if rhr_values else None
+        # One pass over the wellness entries for both averages — running
+        # sums and counts instead of two filtered intermediate lists
+        hrv_sum = hrv_n = rhr_sum = rhr_n = 0
+        for w in wellness:
+            hrv = w.get("hrv")
+            # Inline of _is_valid_hrv — avoids a method call per entry
+            if hrv is not None and 10 <= hrv <= 250:
+                hrv_sum += hrv
+                hrv_n += 1
+            rhr = w.get("restingHR")
+            if rhr:
+                rhr_sum += rhr
+                rhr_n += 1
+        avg_hrv = round(hrv_sum / hrv_n, 1) if hrv_n else None
+        avg_rhr = round(rhr_sum / rhr_n, 1) if rhr_n else None
 
         return {
             "total_training_hours": round(total_hours, 2),
@@ -3250,23 +3728,33 @@ class IntervalsSync:
             "avg_resting_hr": avg_rhr
         }
     
-    def _compute_activity_summary(self, activities: List[Dict], days_back: int = 7) -> Dict:
-        """Compute summary by activity type with human-readable format"""
-        by_type = defaultdict(lambda: {"count": 0, "seconds": 0, "tss": 0, "distance_km": 0})
-        
+    def _compute_activity_summary(self, activities: List[Dict], days_back: int = 7,
+                                  totals: Tuple[float, float] = None) -> Dict:
+        """
+        Compute summary by activity type with human-readable format.
+
+        Accepts optional pre-aggregated (total_seconds, total_tss) to skip
+        re-summing the grand total when the caller already has it.
+        """
+        # Plain dict with a first-touch branch, like the daily aggregation
+        # pass — skips defaultdict's __missing__ dispatch and re-probing
+        # by_type[activity_type] for every field
+        by_type = {}
         for act in activities:
             activity_type = act.get("type", "Unknown")
-            by_type[activity_type]["count"] += 1
-            
-            time_seconds = act.get("moving_time", 0)
-            
-            by_type[activity_type]["seconds"] += time_seconds
-            by_type[activity_type]["tss"] += act.get("icu_training_load", 0) or 0
-            by_type[activity_type]["distance_km"] += (act.get("distance", 0) or 0) / 1000
+            data = by_type.get(activity_type)
+            if data is None:
+                data = by_type[activity_type] = {
+                    "count": 0, "seconds": 0, "tss": 0, "distance_km": 0
+                }
+            data["count"] += 1
+            data["seconds"] += act["_moving"]
+            data["tss"] += act["_tss"]
+            data["distance_km"] += (act.get("distance", 0) or 0) / 1000
         
         activity_breakdown = {}
-        total_seconds = 0
-        
+        total_seconds = totals[0] if totals is not None else 0
+
         for activity_type, data in sorted(by_type.items()):
             activity_breakdown[activity_type] = {
                 "duration_decimal_hours": round(data["seconds"] / 3600, 2),
@@ -3274,8 +3762,9 @@ class IntervalsSync:
                 "tss": round(data["tss"], 0),
                 "distance_km": round(data["distance_km"], 1)
             }
-            total_seconds += data["seconds"]
-        
+            if totals is None:
+                total_seconds += data["seconds"]
+
         return {
             "period_description": f"Last {days_back} days of training (including today)",
             "note": "Duration calculated from API moving_time field.",
@@ -3291,24 +3780,33 @@ class IntervalsSync:
             raise ValueError("GitHub token and repo required for publishing")
         
         if not commit_message:
-            commit_message = f"Update training data - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        
-        headers = {
-            "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github+json"
-        }
-        
+            # Per-run wall-clock snapshot — multi-file publishes in one
+            # sync share the same default message timestamp
+            commit_message = f"Update training data - {self._now.strftime('%Y-%m-%d %H:%M:%S')}"
+        
+        # Session carries the GitHub Accept header; only auth is per call
+        headers = {"Authorization": f"token {self.github_token}"}
+
+        # Encode once — the same bytes serve the no-change comparison and
+        # the upload payload, and the orjson path skips the pure-Python
+        # pretty-printer for this number-heavy payload
+        new_bytes = _dumps_json_bytes(data, default=str)
+        # The contents API reports the file's Git blob sha, so hashing
+        # the new payload in Git's blob object format ("blob <len>\0" +
+        # bytes) detects "no changes" without base64-decoding and
+        # byte-comparing the existing content
+        local_sha = hashlib.sha1(
+            b"blob " + str(len(new_bytes)).encode() + b"\0" + new_bytes
+        ).hexdigest()
+
         url = f"{self.GITHUB_API_URL}/repos/{self.github_repo}/contents/{filepath}"
         try:
-            response = requests.get(url, headers=headers)
+            response = self._gh_session.get(url, headers=headers, timeout=30)
             if response.status_code == 200:
                 current_file = response.json()
                 current_sha = current_file["sha"]
-                
-                current_content = base64.b64decode(current_file["content"]).decode()
-                new_content = json.dumps(data, indent=2, default=str)
-                
-                if current_content == new_content:
+
+                if current_sha == local_sha:
                     print("⏭️  No changes detected, skipping update")
                     raw_url = f"https://raw.githubusercontent.com/{self.github_repo}/main/{filepath}"
                     return raw_url
@@ -3317,9 +3815,8 @@ class IntervalsSync:
         except Exception as e:
             print(f"⚠️  Could not check existing file: {e}")
             current_sha = None
-        
-        content_json = json.dumps(data, indent=2, default=str)
-        content_base64 = base64.b64encode(content_json.encode()).decode()
+
+        content_base64 = base64.b64encode(new_bytes).decode()
         
         payload = {
             "message": commit_message,
@@ -3330,16 +3827,31 @@ class IntervalsSync:
         if current_sha:
             payload["sha"] = current_sha
         
-        response = requests.put(url, headers=headers, json=payload)
+        response = self._gh_session.put(url, headers=headers, json=payload, timeout=30)
         response.raise_for_status()
         
         raw_url = f"https://raw.githubusercontent.com/{self.github_repo}/main/{filepath}"
         return raw_url
     
-    def save_to_file(self, data: Dict, filepath: str = "latest.json"):
-        """Save data to local JSON file"""
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+    def save_to_file(self, data: Dict, filepath: str = "latest.json",
+                     compress: bool = False):
+        """
+        Save data to local JSON file.
+
+        With compress=True the payload is gzip-compressed to
+        '<filepath>.gz' — the repetitive API field names compress well,
+        and gzip-6 is cheap next to the JSON encode itself.
+        """
+        if compress:
+            gz_path = f"{filepath}.gz"
+            with gzip.open(gz_path, "wb", compresslevel=6) as f:
+                f.write(_dumps_json_bytes(data, default=str))
+            print(f"Data saved to {gz_path}")
+            return gz_path
+        # _write_json picks orjson when installed — the payload is
+        # number-heavy (daily TSS arrays, PMC floats), where the optimized
+        # encoder wins biggest
+        _write_json(filepath, data, default=str)
         print(f"Data saved to {filepath}")
         return filepath
 
@@ -3361,10 +3873,24 @@ def main():
     
     if args.setup:
         print("=== Intervals.icu Sync Setup ===\n")
-        athlete_id = input("Intervals.icu Athlete ID (e.g., i123456): ")
-        intervals_key = input("Intervals.icu API Key: ")
-        github_token = input("GitHub Personal Access Token (or press Enter to skip): ")
-        github_repo = input("GitHub Repository (username/repo, or press Enter to skip): ")
+        if sys.stdin.isatty():
+            athlete_id = input("Intervals.icu Athlete ID (e.g., i123456): ")
+            intervals_key = input("Intervals.icu API Key: ")
+            github_token = input("GitHub Personal Access Token (or press Enter to skip): ")
+            github_repo = input("GitHub Repository (username/repo, or press Enter to skip): ")
+        else:
+            # Scripted setup: stdin is a pipe, so read it once and parse
+            # KEY=VALUE lines, e.g.
+            #   printf 'ATHLETE_ID=i123\nINTERVALS_KEY=abc\n' | python sync.py --setup
+            kv = {}
+            for line in sys.stdin.read().splitlines():
+                if "=" in line:
+                    key, value = line.split("=", 1)
+                    kv[key.strip()] = value.strip()
+            athlete_id = kv.get("ATHLETE_ID", "")
+            intervals_key = kv.get("INTERVALS_KEY", "")
+            github_token = kv.get("GITHUB_TOKEN", "")
+            github_repo = kv.get("GITHUB_REPO", "")
         
         config = {
             "athlete_id": athlete_id,
@@ -3375,8 +3901,7 @@ def main():
         if github_repo:
             config["github_repo"] = github_repo
             
-        with open(".sync_config.json", "w") as f:
-            json.dump(config, f, indent=2)
+        _write_json(".sync_config.json", config)
         print("\n✅ Config saved to .sync_config.json")
         print("\nUsage:")
         print("  Export locally:    python sync.py --output latest.json")
@@ -3385,9 +3910,15 @@ def main():
         return
     
     config = {}
-    if os.path.exists(".sync_config.json"):
-        with open(".sync_config.json") as f:
-            config = json.load(f)
+    try:
+        st = os.stat(".sync_config.json")
+    except FileNotFoundError:
+        pass
+    else:
+        # One stat answers both "is it there" and "is it non-empty",
+        # so an empty file never reaches the JSON parser
+        if st.st_size:
+            config = _load_json(".sync_config.json")
     
     athlete_id = args.athlete_id or config.get("athlete_id") or os.getenv("ATHLETE_ID")
     intervals_key = args.intervals_key or config.get("intervals_key") or os.getenv("INTERVALS_KEY")
@@ -3440,48 +3971,58 @@ def main():
     dm = data.get("derived_metrics", {})
     alerts = data.get("alerts", [])
     
-    # Common display function
+    # Common display function. Collects the whole summary into one
+    # buffer and prints once — a hoisted dm.get binding and a single
+    # stdout write instead of ~25 print calls
     def print_summary():
-        print(f"\n📊 Derived metrics:")
-        print(f"   ACWR: {dm.get('acwr')} ({dm.get('acwr_interpretation')})")
-        print(f"   Recovery Index: {dm.get('recovery_index')}")
-        print(f"   Monotony: {dm.get('monotony')} ({dm.get('monotony_interpretation')})")
-        print(f"   Strain: {dm.get('strain')}")
-        print(f"   Gray Zone %: {dm.get('grey_zone_percentage')}%")
-        print(f"   Quality Intensity %: {dm.get('quality_intensity_percentage')}%")
-        print(f"   Polarisation: {dm.get('polarisation_index')} (target ~0.80)")
-        tid = dm.get('seiler_tid_7d', {})
-        tid_ps = dm.get('seiler_tid_7d_primary', {})
-        print(f"   Seiler TID: {tid.get('classification')} (PI: {tid.get('polarization_index')}) — Z1:{tid.get('z1_pct')}% Z2:{tid.get('z2_pct')}% Z3:{tid.get('z3_pct')}%")
+        g = dm.get
+        tid = g('seiler_tid_7d', {})
+        tid_ps = g('seiler_tid_7d_primary', {})
+        bi_indoor = g('benchmark_indoor', {})
+        bi_outdoor = g('benchmark_outdoor', {})
+
+        lines = [
+            "\n📊 Derived metrics:",
+            f"   ACWR: {g('acwr')} ({g('acwr_interpretation')})",
+            f"   Recovery Index: {g('recovery_index')}",
+            f"   Monotony: {g('monotony')} ({g('monotony_interpretation')})",
+            f"   Strain: {g('strain')}",
+            f"   Gray Zone %: {g('grey_zone_percentage')}%",
+            f"   Quality Intensity %: {g('quality_intensity_percentage')}%",
+            f"   Polarisation: {g('polarisation_index')} (target ~0.80)",
+            f"   Seiler TID: {tid.get('classification')} (PI: {tid.get('polarization_index')}) — Z1:{tid.get('z1_pct')}% Z2:{tid.get('z2_pct')}% Z3:{tid.get('z3_pct')}%",
+        ]
         if tid_ps:
-            print(f"   Seiler TID ({tid_ps.get('sport')}): {tid_ps.get('classification')} (PI: {tid_ps.get('polarization_index')}) — Z1:{tid_ps.get('z1_pct')}% Z2:{tid_ps.get('z2_pct')}% Z3:{tid_ps.get('z3_pct')}%")
-        print(f"   Consistency: {dm.get('consistency_index')}")
-        print(f"   Phase: {dm.get('phase_detected')}")
-        print(f"\n📈 Performance (from API):")
-        print(f"   eFTP: {dm.get('eftp')}W")
-        print(f"   W': {dm.get('w_prime_kj')}kJ")
-        print(f"   P-max: {dm.get('p_max')}W")
-        print(f"   VO2max: {dm.get('vo2max')}")
-        bi_indoor = dm.get('benchmark_indoor', {})
-        bi_outdoor = dm.get('benchmark_outdoor', {})
-        print(f"   Indoor FTP:  {bi_indoor.get('current_ftp')}W → Benchmark: {bi_indoor.get('benchmark_percentage') or 'N/A (need 8 weeks)'}")
-        print(f"   Outdoor FTP: {bi_outdoor.get('current_ftp')}W → Benchmark: {bi_outdoor.get('benchmark_percentage') or 'N/A (need 8 weeks)'}")
-        
-        # Display alerts
+            lines.append(f"   Seiler TID ({tid_ps.get('sport')}): {tid_ps.get('classification')} (PI: {tid_ps.get('polarization_index')}) — Z1:{tid_ps.get('z1_pct')}% Z2:{tid_ps.get('z2_pct')}% Z3:{tid_ps.get('z3_pct')}%")
+        lines += [
+            f"   Consistency: {g('consistency_index')}",
+            f"   Phase: {g('phase_detected')}",
+            "\n📈 Performance (from API):",
+            f"   eFTP: {g('eftp')}W",
+            f"   W': {g('w_prime_kj')}kJ",
+            f"   P-max: {g('p_max')}W",
+            f"   VO2max: {g('vo2max')}",
+            f"   Indoor FTP:  {bi_indoor.get('current_ftp')}W → Benchmark: {bi_indoor.get('benchmark_percentage') or 'N/A (need 8 weeks)'}",
+            f"   Outdoor FTP: {bi_outdoor.get('current_ftp')}W → Benchmark: {bi_outdoor.get('benchmark_percentage') or 'N/A (need 8 weeks)'}",
+        ]
+
+        # Alerts
         if alerts:
-            print(f"\n⚠️  Alerts ({len(alerts)}):")
+            lines.append(f"\n⚠️  Alerts ({len(alerts)}):")
             for alert in alerts:
-                icon = "🔴" if alert["severity"] == "alarm" else "🟡" if alert["severity"] == "warning" else "ℹ️"
-                print(f"   {icon} [{alert['severity'].upper()}] {alert['metric']}: {alert['context']}")
+                icon = _ALERT_ICON.get(alert["severity"], "ℹ️")
+                lines.append(f"   {icon} [{alert['severity'].upper()}] {alert['metric']}: {alert['context']}")
         else:
-            print(f"\n✅ No alerts — green light")
-        
-        # Display history confidence
+            lines.append("\n✅ No alerts — green light")
+
+        # History confidence
         history_info = data.get("history", {})
         if history_info.get("available"):
-            print(f"\n📚 History: available ({history_info.get('history_confidence')} confidence, {history_info.get('total_months')}mo)")
+            lines.append(f"\n📚 History: available ({history_info.get('history_confidence')} confidence, {history_info.get('total_months')}mo)")
         else:
-            print(f"\n📚 History: not available (will auto-generate on this run)")
+            lines.append("\n📚 History: not available (will auto-generate on this run)")
+
+        print("\n".join(lines))
     
     if args.output:
         filepath = sync.save_to_file(data, args.output)
@@ -3495,11 +4036,10 @@ def main():
         if sync.should_generate_history():
             try:
                 print("\n📊 Auto-generating history.json...")
-                history = sync.generate_history()
-                history_path = sync.script_dir / sync.HISTORY_FILE
-                with open(history_path, 'w') as f:
-                    json.dump(history, f, indent=2, default=str)
-                print(f"   ✅ history.json saved to {history_path}")
+                # generate_history persists history.json itself — no
+                # second serialize-and-write of the largest payload here
+                sync.generate_history()
+                print(f"   ✅ history.json saved to {sync.script_dir / sync.HISTORY_FILE}")
             except Exception as e:
                 print(f"   ⚠️ History generation failed (non-critical): {e}")
     else:
@@ -3515,23 +4055,37 @@ def main():
         print(f'   "Analyze my training data from {raw_url}"')
         
         # === AUTO HISTORY GENERATION (Sundays/Mondays, first two runs after midnight) ===
+        history = None
         if sync.should_generate_history():
             try:
                 print("\n📊 Auto-generating history.json...")
                 history = sync.generate_history()
-                sync.publish_to_github(history, filepath="history.json",
-                                       commit_message=f"Auto-generate history.json - {datetime.now().strftime('%Y-%m-%d')}")
-                print("   ✅ history.json auto-generated and pushed to GitHub")
             except Exception as e:
                 print(f"   ⚠️ History generation failed (non-critical): {e}")
-        
-        # === UPDATE NOTIFICATIONS ===
-        try:
-            print("\n🔔 Checking for upstream updates...")
-            sync.check_upstream_updates()
-        except Exception as e:
-            if args.debug:
-                print(f"   ⚠️ Update check failed (non-critical): {e}")
+
+        # === HISTORY PUBLISH + UPDATE NOTIFICATIONS ===
+        # Independent endpoints, so the two post-run network calls
+        # overlap — same pattern as the fetch phase. Each keeps its own
+        # non-critical error handling.
+        print("\n🔔 Checking for upstream updates...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_update = executor.submit(sync.check_upstream_updates)
+            future_publish = None
+            if history is not None:
+                future_publish = executor.submit(
+                    sync.publish_to_github, history, filepath="history.json",
+                    commit_message=f"Auto-generate history.json - {datetime.now().strftime('%Y-%m-%d')}")
+            if future_publish is not None:
+                try:
+                    future_publish.result()
+                    print("   ✅ history.json auto-generated and pushed to GitHub")
+                except Exception as e:
+                    print(f"   ⚠️ History generation failed (non-critical): {e}")
+            try:
+                future_update.result()
+            except Exception as e:
+                if args.debug:
+                    print(f"   ⚠️ Update check failed (non-critical): {e}")
 
 
 if __name__ == "__main__":